@@ -20,7 +20,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ProgressEvent:
     """
     Structured progress event for video generation
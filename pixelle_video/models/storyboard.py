@@ -16,7 +16,8 @@ Storyboard data models for video generation
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from functools import cached_property
+from typing import List, Literal, Optional, Dict, Any
 
 
 @dataclass
@@ -38,6 +39,7 @@ class StoryboardConfig:
     
     # Video parameters (fps only, size is determined by frame template)
     video_fps: int = 30                        # Frame rate
+    max_frame_concurrency: int = 1             # Max frames processed concurrently by FrameProcessor.process_all
     
     # Audio parameters
     tts_inference_mode: str = "local"          # TTS inference mode: "local" or "comfyui"
@@ -45,16 +47,29 @@ class StoryboardConfig:
     tts_workflow: Optional[str] = None         # TTS workflow filename (for ComfyUI mode, None = use default)
     tts_speed: Optional[float] = None          # TTS speed multiplier (0.5-2.0, 1.0 = normal)
     ref_audio: Optional[str] = None            # Reference audio for voice cloning (ComfyUI mode only)
+    cache_tts: Optional[bool] = None           # Reuse cached TTS audio for identical text and resolved settings (None = local Edge TTS only; ComfyUI voice cloning may be non-deterministic)
+    prewarm_tts: bool = False                  # Generate all audio before any media (serializes TTS ahead of media; opt-in)
     
     # Media workflow
     media_workflow: Optional[str] = None       # Media workflow filename (image or video, None = use default)
+    cache_media: bool = False                  # Reuse cached media for identical prompt/workflow (generation is stochastic, opt-in)
+    estimate_video_duration: bool = True       # Video workflows: start generation with a narration-based duration estimate instead of waiting for TTS
     
     # Frame template (includes size information in path)
     frame_template: str = "1080x1920/default.html"  # Template path with size (e.g., "1080x1920/default.html")
     template_params: Optional[Dict[str, Any]] = None  # Custom template parameters (e.g., {"accent_color": "#ff0000"})
+    
+    @cached_property
+    def media_workflow_kind(self) -> Literal["image", "video"]:
+        """
+        Kind of media produced by media_workflow (computed once per config)
+        
+        A "video_" prefix in the workflow name indicates video generation.
+        """
+        return "video" if "video_" in (self.media_workflow or "").lower() else "image"
 
 
-@dataclass
+@dataclass(slots=True)
 class StoryboardFrame:
     """Single storyboard frame"""
     index: int                                 # Frame index (0-based)
@@ -32,6 +32,7 @@ Example:
     )
 """
 
+from collections import Counter
 from typing import List, Dict, Any, Optional, Callable
 from pathlib import Path
 
@@ -413,15 +414,12 @@ class AssetBasedPipeline(LinearVideoPipeline):
             for scene in context.script
         ]
         
-        # Log asset usage summary
-        asset_usage = {}
-        for scene in context.matched_scenes:
-            asset = scene["matched_asset"]
-            asset_usage[asset] = asset_usage.get(asset, 0) + 1
-        
-        logger.info(f"📊 Asset usage summary:")
-        for asset_path, count in asset_usage.items():
-            logger.info(f"   {Path(asset_path).name}: {count} scene(s)")
+        # Log asset usage summary (one log record for all assets)
+        asset_usage = Counter(scene["matched_asset"] for scene in context.matched_scenes)
+        logger.info("📊 Asset usage summary:\n" + "\n".join(
+            f"   {Path(asset_path).name}: {count} scene(s)"
+            for asset_path, count in asset_usage.items()
+        ))
         
         return context
     
@@ -522,9 +520,6 @@ class AssetBasedPipeline(LinearVideoPipeline):
                 frame.image_path = asset_path
                 logger.debug(f"Scene {i}: Using image asset: {Path(asset_path).name}")
             
-            # Store scene info for later audio generation
-            frame._scene_data = scene  # Temporary storage for multi-narration
-            
             context.storyboard.frames.append(frame)
         
         logger.info(f"✅ Created storyboard with {len(context.storyboard.frames)} scenes")
@@ -565,8 +560,8 @@ class AssetBasedPipeline(LinearVideoPipeline):
                 action="audio"
             ))
             
-            # Get scene data with narrations
-            scene = frame._scene_data
+            # Get scene data with narrations (frames are created one per matched scene)
+            scene = context.matched_scenes[frame.index]
             narrations = scene.get("narrations", [scene.get("narration", "")])
             if isinstance(narrations, str):
                 narrations = [narrations]
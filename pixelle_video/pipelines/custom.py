@@ -157,7 +157,8 @@ class CustomPipeline(BasePipeline):
         # Create task directory
         from pixelle_video.utils.os_util import (
             create_task_output_dir,
-            get_task_final_video_path
+            get_task_final_video_path,
+            link_or_copy
         )
         
         task_dir, task_id = create_task_output_dir()
@@ -348,9 +349,8 @@ class CustomPipeline(BasePipeline):
             
             # Copy to user-specified path if provided
             if user_specified_output:
-                import shutil
                 Path(user_specified_output).parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(final_video_path, user_specified_output)
+                link_or_copy(final_video_path, user_specified_output)
                 logger.info(f"Final video copied to: {user_specified_output}")
                 final_video_path = user_specified_output
                 storyboard.final_video_path = user_specified_output
@@ -22,7 +22,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional, Callable, Literal, List
 import asyncio
-import shutil
 
 from loguru import logger
 
@@ -43,7 +42,8 @@ from pixelle_video.utils.content_generators import (
 )
 from pixelle_video.utils.os_util import (
     create_task_output_dir,
-    get_task_final_video_path
+    get_task_final_video_path,
+    link_or_copy
 )
 from pixelle_video.utils.template_util import get_template_type
 from pixelle_video.utils.prompt_helper import build_image_prompt
@@ -265,6 +265,7 @@ class StandardPipeline(LinearVideoPipeline):
             tts_workflow=final_tts_workflow,
             tts_speed=ctx.params.get("tts_speed", 1.2),
             ref_audio=ctx.params.get("ref_audio"),
+            prewarm_tts=ctx.params.get("prewarm_tts", False),
             media_width=ctx.params.get("media_width"),
             media_height=ctx.params.get("media_height"),
             media_workflow=ctx.params.get("media_workflow"),
@@ -305,6 +306,27 @@ class StandardPipeline(LinearVideoPipeline):
         from pixelle_video.config import config_manager
         runninghub_concurrent_limit = config_manager.config.comfyui.runninghub_concurrent_limit or 1
         
+        # Fail fast on misconfiguration before any TTS/media call
+        self.core.frame_processor.validate(config, storyboard.frames)
+        
+        # Opt-in: generate all narration audio up front. Off by default, since
+        # per-frame TTS overlaps media generation (and estimated I2V durations)
+        if config.prewarm_tts:
+            def prewarm_progress(completed: int, total: int):
+                self._report_progress(
+                    ctx.progress_callback,
+                    "generating_audio",
+                    0.15 + 0.05 * completed / total,
+                    extra_info=f"{completed}/{total}"
+                )
+            
+            await self.core.frame_processor.prewarm_tts(
+                storyboard.frames,
+                config,
+                max_concurrency=runninghub_concurrent_limit if is_runninghub else 4,
+                progress_callback=prewarm_progress
+            )
+        
         if is_runninghub and runninghub_concurrent_limit > 1:
             logger.info(f"🚀 Using parallel processing for RunningHub workflows (max {runninghub_concurrent_limit} concurrent)")
             
@@ -364,44 +386,47 @@ class StandardPipeline(LinearVideoPipeline):
             
             logger.info(f"✅ All frames processed in parallel (total duration: {storyboard.total_duration:.2f}s)")
         else:
-            # Serial processing for non-RunningHub workflows
+            # Serial processing for non-RunningHub workflows, pipelined so that
+            # each frame's ffmpeg encode overlaps the next frame's TTS/media calls
             logger.info("⚙️ Using serial processing (non-RunningHub workflow)")
             
-            for i, frame in enumerate(storyboard.frames):
-                base_progress = 0.2
-                frame_range = 0.6
-                per_frame_progress = frame_range / len(storyboard.frames)
-                
-                # Create frame-specific progress callback
-                def frame_progress_callback(event: ProgressEvent):
-                    overall_progress = base_progress + (per_frame_progress * i) + (per_frame_progress * event.progress)
-                    if ctx.progress_callback:
-                        adjusted_event = ProgressEvent(
-                            event_type=event.event_type,
-                            progress=overall_progress,
-                            frame_current=event.frame_current,
-                            frame_total=event.frame_total,
-                            step=event.step,
-                            action=event.action
-                        )
-                        ctx.progress_callback(adjusted_event)
-                
-                # Report frame start
-                self._report_progress(
-                    ctx.progress_callback,
-                    "processing_frame",
-                    base_progress + (per_frame_progress * i),
-                    frame_current=i+1,
-                    frame_total=len(storyboard.frames)
-                )
-                
-                processed_frame = await self.core.frame_processor(
-                    frame=frame,
-                    storyboard=storyboard,
-                    config=config,
-                    total_frames=len(storyboard.frames),
-                    progress_callback=frame_progress_callback
-                )
+            base_progress = 0.2
+            frame_range = 0.6
+            per_frame_progress = frame_range / len(storyboard.frames)
+            started_frames = set()
+            
+            def frame_progress_callback(event: ProgressEvent):
+                i = event.frame_current - 1
+                if i not in started_frames:
+                    # Report frame start (on its first step event)
+                    started_frames.add(i)
+                    self._report_progress(
+                        ctx.progress_callback,
+                        "processing_frame",
+                        base_progress + (per_frame_progress * i),
+                        frame_current=event.frame_current,
+                        frame_total=event.frame_total
+                    )
+                overall_progress = base_progress + (per_frame_progress * i) + (per_frame_progress * event.progress)
+                if ctx.progress_callback:
+                    adjusted_event = ProgressEvent(
+                        event_type=event.event_type,
+                        progress=overall_progress,
+                        frame_current=event.frame_current,
+                        frame_total=event.frame_total,
+                        step=event.step,
+                        action=event.action
+                    )
+                    ctx.progress_callback(adjusted_event)
+            
+            processed_frames = await self.core.frame_processor.process_all_pipelined(
+                frames=storyboard.frames,
+                storyboard=storyboard,
+                config=config,
+                progress_callback=frame_progress_callback,
+                skip_validation=True
+            )
+            for i, processed_frame in enumerate(processed_frames):
                 storyboard.total_duration += processed_frame.duration
                 logger.info(f"✅ Frame {i+1} completed ({processed_frame.duration:.2f}s)")
 
@@ -429,7 +454,7 @@ class StandardPipeline(LinearVideoPipeline):
         user_specified_output = ctx.params.get("output_path")
         if user_specified_output:
             Path(user_specified_output).parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(final_video_path, user_specified_output)
+            link_or_copy(final_video_path, user_specified_output)
             logger.info(f"📹 Final video copied to: {user_specified_output}")
             ctx.final_video_path = user_specified_output
             storyboard.final_video_path = user_specified_output
@@ -16,6 +16,7 @@ Content narration generation prompt
 For extracting/refining narrations from user-provided content.
 """
 
+from pixelle_video.utils.prompt_helper import JSON_ONLY_INSTRUCTION, JSON_OUTPUT_REMINDERS
 
 CONTENT_NARRATION_PROMPT = """# Role Definition
 Globally, you must strictly output copy in the corresponding language type according to the user's language type.
@@ -24,9 +25,6 @@ You are a professional content refinement expert, skilled at extracting core poi
 # Core Task
 The user will provide content (which may be long or short), and you need to extract narrations for {n_storyboard} video storyboards (for TTS to generate video audio).
 
-# User-Provided Content
-{content}
-
 # Output Requirements
 
 ## Narration Specifications
@@ -66,15 +64,15 @@ Strictly output in the following JSON format, do not add any additional text exp
 ```
 
 # Important Reminders
-1. Only output JSON format content, do not add any explanations
-2. Ensure JSON format is strictly correct and can be directly parsed by the program
-3. Narrations must be strictly controlled between {min_words}~{max_words} words
+""" + JSON_OUTPUT_REMINDERS + """3. Narrations must be strictly controlled between {min_words}~{max_words} words
 4. Must output exactly {n_storyboard} storyboard narrations
 5. Content must be faithful to the user's original meaning, but optimized for voice narration expression
 6. Output format is {{"narrations": [narration array]}} JSON object
 
-Now, please extract {n_storyboard} storyboard narrations from the above content. Only output JSON, no other content.
-"""
+# User-Provided Content
+{content}
+
+Now, please extract {n_storyboard} storyboard narrations from the above content. """ + JSON_ONLY_INSTRUCTION + "\n"
 
 
 def build_content_narration_prompt(
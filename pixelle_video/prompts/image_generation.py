@@ -16,14 +16,23 @@ Image prompt generation template
 For generating image prompts from narrations.
 """
 
-import json
-from typing import List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final, List, Mapping, Optional, Tuple
+
+from pixelle_video.utils.prompt_helper import (
+    JSON_ONLY_INSTRUCTION,
+    JSON_OUTPUT_REMINDERS,
+    compile_template,
+    narrations_json_fragments,
+    render_template,
+)
 
 
 # ==================== PRESET IMAGE STYLES ====================
-# Predefined visual styles for different use cases
+# Predefined visual styles for different use cases (read-only mapping)
 
-IMAGE_STYLE_PRESETS = {
+IMAGE_STYLE_PRESETS: Final[Mapping[str, dict]] = MappingProxyType({
     "stick_figure": {
         "name": "Stick Figure Sketch",
         "description": "stick figure style sketch, black and white lines, pure white background, minimalist hand-drawn feel",
@@ -41,10 +50,10 @@ IMAGE_STYLE_PRESETS = {
         "description": "conceptual visual metaphors, symbolic elements, thought-provoking imagery, artistic interpretation",
         "use_case": "Deep content, philosophical thinking"
     },
-}
+})
 
 # Default preset
-DEFAULT_IMAGE_STYLE = "stick_figure"
+DEFAULT_IMAGE_STYLE: Final[str] = "stick_figure"
 
 
 IMAGE_PROMPT_GENERATION_PROMPT = """# Role Definition
@@ -53,10 +62,7 @@ You are a professional visual creative designer, skilled at creating expressive
 # Core Task
 Based on the existing video script, create corresponding **English** image prompts for each storyboard's "narration content", ensuring visual scenes perfectly match the narrative content and enhance audience understanding and memory.
 
-**Important: The input contains {narrations_count} narrations. You must generate one corresponding image prompt for each narration, totaling {narrations_count} image prompts.**
-
-# Input Content
-{narrations_json}
+**Important: You must generate one corresponding image prompt for each input narration.**
 
 # Output Requirements
 
@@ -104,17 +110,21 @@ Strictly output in the following JSON format, **image prompts must be in English
 ```
 
 # Important Reminders
-1. Only output JSON format content, do not add any explanations
-2. Ensure JSON format is strictly correct and can be directly parsed by the program
-3. Input is {{"narrations": [narration array]}} format, output is {{"image_prompts": [image prompt array]}} format
-4. **The output image_prompts array must contain exactly {narrations_count} elements, corresponding one-to-one with the input narrations array**
+""" + JSON_OUTPUT_REMINDERS + """3. Input is {{"narrations": [narration array]}} format, output is {{"image_prompts": [image prompt array]}} format
+4. **The output image_prompts array must contain exactly as many elements as the input narrations array, corresponding one-to-one**
 5. **Image prompts must use English** (for AI image generation models)
 6. Image prompts must accurately reflect the specific content and emotion of the corresponding narration
 7. Each image must be creative and visually impactful, avoid being monotonous
 8. Ensure visual scenes can enhance the persuasiveness of the copy and audience understanding
 
-Now, please create {narrations_count} corresponding **English** image prompts for the above {narrations_count} narrations. Only output JSON, no other content.
-"""
+# Input Content
+{narrations_json}
+
+**Important: The input contains {narrations_count} narrations. The output image_prompts array must contain exactly {narrations_count} elements.**
+
+Now, please create {narrations_count} corresponding **English** image prompts for the above {narrations_count} narrations. """ + JSON_ONLY_INSTRUCTION + "\n"
+
+_IMAGE_PROMPT_GENERATION_TEMPLATE = compile_template(IMAGE_PROMPT_GENERATION_PROMPT)
 
 
 def build_image_prompt_prompt(
@@ -138,16 +148,22 @@ def build_image_prompt_prompt(
     Example:
         >>> build_image_prompt_prompt(narrations, 50, 100)
     """
-    narrations_json = json.dumps(
-        {"narrations": narrations},
-        ensure_ascii=False,
-        indent=2
-    )
+    return _build_image_prompt_prompt(tuple(narrations), min_words, max_words)
+
+
+@lru_cache(maxsize=64)
+def _build_image_prompt_prompt(
+    narrations: Tuple[str, ...],
+    min_words: int,
+    max_words: int
+) -> str:
+    """Cached implementation of build_image_prompt_prompt (hashable args)"""
+    narrations_json = narrations_json_fragments(narrations)
     
-    return IMAGE_PROMPT_GENERATION_PROMPT.format(
-        narrations_json=narrations_json,
-        narrations_count=len(narrations),
-        min_words=min_words,
-        max_words=max_words
-    )
+    return render_template(_IMAGE_PROMPT_GENERATION_TEMPLATE, {
+        "narrations_json": narrations_json,
+        "narrations_count": len(narrations),
+        "min_words": min_words,
+        "max_words": max_words,
+    })
 
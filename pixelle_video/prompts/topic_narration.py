@@ -16,6 +16,7 @@ Topic narration generation prompt
 For generating narrations from a topic/theme.
 """
 
+from pixelle_video.utils.prompt_helper import JSON_ONLY_INSTRUCTION, JSON_OUTPUT_REMINDERS
 
 TOPIC_NARRATION_PROMPT = """# Role Definition
 You are a professional content creation expert, skilled at expanding topics into engaging short video scripts, explaining viewpoints in an accessible way to help audiences understand complex concepts.
@@ -25,9 +26,6 @@ Globally, you must strictly output copy in the corresponding language type accor
 The user will input a topic or theme. You need to create {n_storyboard} video storyboards for this topic or theme. Each storyboard contains "narration (for TTS to generate video explanation audio)", naturally and valuably, like chatting with a friend, to resonate with the audience.
 - Language consistency requirement: Strictly output copy according to the user's input language type - if input is English, output must be English, and so on
 
-# Input Topic
-{topic}
-
 # Output Requirements
 
 ## Narration Specifications
@@ -111,9 +109,7 @@ Strictly output in the following JSON format, do not add any additional text exp
 ```
 
 # Important Reminders
-1. Only output JSON format content, do not add any explanations
-2. Ensure JSON format is strictly correct and can be directly parsed by the program
-3. Narrations must be strictly controlled between {min_words}~{max_words} words, using accessible language
+""" + JSON_OUTPUT_REMINDERS + """3. Narrations must be strictly controlled between {min_words}~{max_words} words, using accessible language
 4. {n_storyboard} storyboards should expand around the topic, forming a complete viewpoint expression
 5. Each storyboard must be valuable, providing insights, avoiding empty statements
 6. Output format is {{"narrations": [narration array]}} JSON object
@@ -125,10 +121,12 @@ Strictly output in the following JSON format, do not add any additional text exp
 10. Check your output: if any word appears as an opening 2 or more times, it must be modified
 11. Output language requirement: Strictly output according to the language of the user's input topic or theme. For example: if the user's input is in English, the output copy must be in English, same for Chinese.
 
+# Input Topic
+{topic}
+
 Now, please create narrations for {n_storyboard} storyboards for the topic.
 ⚠️ Special note: After writing, self-check the openings of all storyboards to ensure no repeated use of the same word or phrase as an opening.
-Only output JSON, no other content.
-"""
+""" + JSON_ONLY_INSTRUCTION + "\n"
 
 
 def build_topic_narration_prompt(
@@ -16,20 +16,27 @@ Video prompt generation template
 For generating video prompts from narrations.
 """
 
-import json
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
+from pixelle_video.utils.prompt_helper import (
+    JSON_ONLY_INSTRUCTION,
+    JSON_OUTPUT_REMINDERS,
+    compile_template,
+    narrations_json_fragments,
+    render_template,
+)
 
-VIDEO_PROMPT_GENERATION_PROMPT = """# Role Definition
+
+# Static part of the prompt: contains no placeholders, so it is byte-identical
+# across calls and can be served from the LLM provider's prefix cache.
+VIDEO_PROMPT_GENERATION_SYSTEM_PROMPT = """# Role Definition
 You are a professional video creative designer, skilled at creating dynamic and expressive video generation prompts for video scripts, transforming narrative content into vivid video scenes.
 
 # Core Task
 Based on the existing video script, create corresponding **English** video generation prompts for each storyboard's "narration content", ensuring video scenes perfectly match the narrative content and enhance audience understanding and memory through dynamic visuals.
 
-**Important: The input contains {narrations_count} narrations. You must generate one corresponding video prompt for each narration, totaling {narrations_count} video prompts.**
-
-# Input Content
-{narrations_json}
+**Important: You must generate one corresponding video prompt for each input narration.**
 
 # Output Requirements
 
@@ -76,28 +83,81 @@ Based on the existing video script, create corresponding **English** video gener
 Strictly output in the following JSON format, **video prompts must be in English**:
 
 ```json
-{{
+{
   "video_prompts": [
     "[detailed English video prompt with dynamic elements and camera movements]",
     "[detailed English video prompt with dynamic elements and camera movements]"
   ]
-}}
+}
 ```
 
 # Important Reminders
-1. Only output JSON format content, do not add any explanations
-2. Ensure JSON format is strictly correct and can be directly parsed by the program
-3. Input is {{"narrations": [narration array]}} format, output is {{"video_prompts": [video prompt array]}} format
-4. **The output video_prompts array must contain exactly {narrations_count} elements, corresponding one-to-one with the input narrations array**
+""" + JSON_OUTPUT_REMINDERS + """3. Input is {"narrations": [narration array]} format, output is {"video_prompts": [video prompt array]} format
+4. **The output video_prompts array must contain exactly as many elements as the input narrations array, corresponding one-to-one**
 5. **Video prompts must use English** (for AI video generation models)
 6. Video prompts must accurately reflect the specific content and emotion of the corresponding narration
 7. Each video must emphasize dynamics and sense of movement, avoid static descriptions
 8. Appropriately use camera language to enhance expressiveness
 9. Ensure video scenes can enhance the persuasiveness of the copy and audience understanding
-
-Now, please create {narrations_count} corresponding **English** video prompts for the above {narrations_count} narrations. Only output JSON, no other content.
 """
 
+# Dynamic part of the prompt: everything that changes per call lives here,
+# after the static prefix.
+VIDEO_PROMPT_GENERATION_USER_PROMPT = """# Input Content
+{narrations_json}
+
+**Important: The input contains {narrations_count} narrations. The output video_prompts array must contain exactly {narrations_count} elements.**
+
+Now, please create {narrations_count} corresponding **English** video prompts for the above {narrations_count} narrations. """ + JSON_ONLY_INSTRUCTION + "\n"
+
+_VIDEO_PROMPT_GENERATION_USER_TEMPLATE = compile_template(VIDEO_PROMPT_GENERATION_USER_PROMPT)
+
+
+def build_video_prompt_messages(
+    narrations: List[str],
+    min_words: int,
+    max_words: int
+) -> Tuple[str, str]:
+    """
+    Build video prompt generation prompt as (system_prompt, user_prompt)
+    
+    The system prompt is fully static, so sending it as a separate leading
+    message lets providers with automatic prefix caching (OpenAI, DeepSeek,
+    Qwen, Gemini) reuse it across calls.
+    
+    Args:
+        narrations: List of narrations
+        min_words: Minimum word count
+        max_words: Maximum word count
+    
+    Returns:
+        Tuple of (static system prompt, dynamic user prompt)
+    
+    Example:
+        >>> system_prompt, prompt = build_video_prompt_messages(narrations, 50, 100)
+        >>> await llm_service(prompt=prompt, system_prompt=system_prompt)
+    """
+    return _build_video_prompt_messages(tuple(narrations), min_words, max_words)
+
+
+@lru_cache(maxsize=64)
+def _build_video_prompt_messages(
+    narrations: Tuple[str, ...],
+    min_words: int,
+    max_words: int
+) -> Tuple[str, str]:
+    """Cached implementation of build_video_prompt_messages (hashable args)"""
+    narrations_json = narrations_json_fragments(narrations)
+    
+    user_prompt = render_template(_VIDEO_PROMPT_GENERATION_USER_TEMPLATE, {
+        "narrations_json": narrations_json,
+        "narrations_count": len(narrations),
+        "min_words": min_words,
+        "max_words": max_words,
+    })
+    
+    return VIDEO_PROMPT_GENERATION_SYSTEM_PROMPT, user_prompt
+
 
 def build_video_prompt_prompt(
     narrations: List[str],
@@ -118,16 +178,10 @@ def build_video_prompt_prompt(
     Example:
         >>> build_video_prompt_prompt(narrations, 50, 100)
     """
-    narrations_json = json.dumps(
-        {"narrations": narrations},
-        ensure_ascii=False,
-        indent=2
-    )
-    
-    return VIDEO_PROMPT_GENERATION_PROMPT.format(
-        narrations_json=narrations_json,
-        narrations_count=len(narrations),
+    system_prompt, user_prompt = build_video_prompt_messages(
+        narrations=narrations,
         min_words=min_words,
         max_words=max_words
     )
-
+    
+    return f"{system_prompt}\n{user_prompt}"
@@ -221,11 +221,17 @@ class PixelleVideoCore:
     
     async def cleanup(self):
         """
-        Cleanup resources (close ComfyKit session)
+        Cleanup resources (close ComfyKit session and shared HTTP clients)
         
         Example:
             await pixelle_video.cleanup()
         """
+        if self.frame_processor:
+            try:
+                await self.frame_processor.aclose()
+            except Exception as e:
+                logger.warning(f"Failed to close frame processor HTTP client: {e}")
+        
         if self._comfykit:
             logger.info("🧹 Closing ComfyKit session...")
             try:
@@ -16,8 +16,9 @@ ComfyUI Base Service - Common logic for ComfyUI-based services
 
 import json
 import os
+import time
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 from comfykit import ComfyKit
 from loguru import logger
@@ -29,6 +30,11 @@ from pixelle_video.utils.os_util import (
 )
 
 
+# Workflow directory scans are reused for this many seconds; every web UI
+# rerun lists workflows, while the files themselves rarely change
+_WORKFLOW_SCAN_TTL = 60.0
+
+
 class ComfyBaseService:
     """
     Base service for ComfyUI workflow-based capabilities
@@ -62,7 +68,10 @@ class ComfyBaseService:
         self.global_config = comfyui_config
         
         self.service_name = service_name
-        self._workflows_cache: Optional[List[str]] = None
+        # (monotonic timestamp, scan result, scan result by key) of the last workflow scan
+        self._workflows_cache: Optional[
+            Tuple[float, List[Dict[str, Any]], Dict[str, Dict[str, Any]]]
+        ] = None
         
         # Reference to core (for accessing shared ComfyKit)
         self.core = core
@@ -71,6 +80,10 @@ class ComfyBaseService:
         """
         Scan workflows/source/*.json files from all source directories (merged from workflows/ and data/workflows/)
         
+        Results are cached for _WORKFLOW_SCAN_TTL seconds; each call returns
+        a new list, but the workflow info dicts are shared and must not be
+        modified.
+        
         Returns:
             List of workflow info dicts
             Example: [
@@ -91,6 +104,19 @@ class ComfyBaseService:
                 }
             ]
         """
+        return list(self._get_workflows_cache()[1])
+    
+    def _get_workflows_cache(self) -> Tuple[float, List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """Current workflow scan cache entry, rescanning once it has expired"""
+        now = time.monotonic()
+        if self._workflows_cache is None or now - self._workflows_cache[0] >= _WORKFLOW_SCAN_TTL:
+            workflows = self._scan_workflow_files()
+            # reversed() keeps the first workflow for a key, as a linear search would
+            self._workflows_cache = (now, workflows, {wf["key"]: wf for wf in reversed(workflows)})
+        return self._workflows_cache
+    
+    def _scan_workflow_files(self) -> List[Dict[str, Any]]:
+        """Uncached workflow scan (see _scan_workflows)"""
         workflows = []
         
         # Get all workflow source directories (merged from workflows/ and data/workflows/)
@@ -211,13 +237,13 @@ class ComfyBaseService:
             workflow = self._get_default_workflow()
         
         # 2. Scan available workflows
-        available_workflows = self._scan_workflows()
+        _, available_workflows, workflows_by_key = self._get_workflows_cache()
         
         # 3. Find matching workflow by key
-        for wf_info in available_workflows:
-            if wf_info["key"] == workflow:
-                logger.info(f"🎬 Using {self.service_name} workflow: {workflow}")
-                return wf_info
+        wf_info = workflows_by_key.get(workflow)
+        if wf_info is not None:
+            logger.info(f"🎬 Using {self.service_name} workflow: {workflow}")
+            return wf_info
         
         # 4. Not found - generate error message
         available_keys = [wf["key"] for wf in available_workflows]
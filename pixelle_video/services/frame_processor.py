@@ -14,19 +14,62 @@
 Frame processor - Process single frame through complete pipeline
 
 Orchestrates: TTS → Image Generation → Frame Composition → Video Segment
+(TTS and image generation run concurrently when they are independent)
 
 Key Feature:
-- TTS-driven video duration: Audio duration from TTS is passed to video generation workflows
-  to ensure perfect sync between audio and video (no padding, no trimming needed)
+- Audio-driven video duration: video generation workflows receive a target duration, and
+  the segment step fits the video to the TTS audio. By default (estimate_video_duration)
+  the target is estimated from the narration so video generation overlaps TTS; the
+  video is then trimmed, or its last frame held, to match the audio exactly. Set
+  estimate_video_duration=False to wait for TTS and pass the real audio duration instead.
 """
 
-from typing import Callable, Optional
+import asyncio
+import importlib.util
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, Optional
 
+import ffmpeg
 import httpx
 from loguru import logger
 
 from pixelle_video.models.progress import ProgressEvent
 from pixelle_video.models.storyboard import Storyboard, StoryboardFrame, StoryboardConfig
+from pixelle_video.services.frame_html import HTMLFrameGenerator
+from pixelle_video.services.video import VideoService
+from pixelle_video.utils.generation_cache import load_cached_output, make_cache_key, save_cached_output
+from pixelle_video.utils.media_probe import probe_audio_duration, probe_video_duration
+from pixelle_video.utils.os_util import get_task_frame_paths
+from pixelle_video.utils.template_util import resolve_template_path
+from pixelle_video.utils.tts_util import estimate_speech_duration
+
+
+# HTTP/2 needs the optional "h2" package (httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_DOWNLOAD_TIMEOUT = httpx.Timeout(connect=10.0, read=60, write=60, pool=60)
+_DOWNLOAD_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+_DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+# Intermediate frame steps closer together than this are not reported
+_PROGRESS_MIN_INTERVAL = 0.05
+
+# ffmpeg encodes are CPU-bound; they run on their own small pool so they
+# neither oversubscribe cores nor starve the default executor used for
+# file I/O and probes
+_FFMPEG_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 1),
+    thread_name_prefix="ffmpeg"
+)
+
+
+@lru_cache(maxsize=256)
+def _frame_paths(task_id: str, frame_index: int) -> Dict[str, str]:
+    """Frame file paths by type, resolved once per (task, frame)"""
+    return get_task_frame_paths(task_id, frame_index)
 
 
 class FrameProcessor:
@@ -40,6 +83,44 @@ class FrameProcessor:
             pixelle_video_core: PixelleVideoCore instance
         """
         self.core = pixelle_video_core
+        
+        # VideoService is stateless; share one instance across frames
+        self._video_service = VideoService()
+        
+        # HTML frame generator for the most recently used template
+        # (loading a template and locating Chrome costs several subprocesses)
+        self._html_generator: Optional[HTMLFrameGenerator] = None
+        
+        # Shared HTTP client for media downloads (lazily created per event loop)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared download client, reusing pooled connections across frames
+        
+        The client is bound to the running event loop; a new one is created
+        when called from a different loop (e.g. successive asyncio.run calls).
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                http2=_HTTP2_AVAILABLE,
+                limits=_DOWNLOAD_LIMITS,
+                timeout=_DOWNLOAD_TIMEOUT,
+            )
+            self._client_loop = loop
+        return self._client
+    
+    async def aclose(self):
+        """Close the shared download client"""
+        if self._client is not None and not self._client.is_closed:
+            try:
+                if self._client_loop is asyncio.get_running_loop():
+                    await self._client.aclose()
+            finally:
+                self._client = None
+                self._client_loop = None
     
     async def __call__(
         self,
@@ -54,7 +135,8 @@ class FrameProcessor:
         
         Steps:
         1. Generate audio (TTS)
-        2. Generate image (ComfyKit)
+        2. Generate media (ComfyKit), concurrently with step 1; video workflows
+           wait for step 1 only when estimate_video_duration is off
         3. Compose frame (add subtitle)
         4. Create video segment (image + audio)
         
@@ -70,83 +152,345 @@ class FrameProcessor:
         """
         logger.info(f"Processing frame {frame.index}...")
         
-        frame_num = frame.index + 1
+        emit_progress = self._make_progress_emitter(frame.index + 1, total_frames, progress_callback)
         
+        try:
+            await self._prepare_frame(frame, storyboard, config, emit_progress)
+            await self._finish_frame(frame, config, emit_progress)
+            
+            logger.info(f"✅ Frame {frame.index} completed")
+            return frame
+
+        except Exception as e:
+            logger.error(f"❌ Failed to process frame {frame.index}: {e}")
+            raise
+    
+    @staticmethod
+    def _make_progress_emitter(
+        frame_num: int,
+        total_frames: int,
+        progress_callback: Optional[Callable[[ProgressEvent], None]]
+    ) -> Callable[..., None]:
+        """
+        Build the per-frame step progress reporter
+        
+        Steps started with force=True are always reported; others are
+        dropped when they follow the previous event within
+        _PROGRESS_MIN_INTERVAL (e.g. composing right after cached media).
+        """
+        last_emit = 0.0
+        
+        def emit_progress(progress: float, step: int, action: str, force: bool = False):
+            nonlocal last_emit
+            if not progress_callback:
+                return
+            now = time.monotonic()
+            if not force and now - last_emit < _PROGRESS_MIN_INTERVAL:
+                return
+            last_emit = now
+            progress_callback(ProgressEvent(
+                event_type="frame_step",
+                progress=progress,
+                frame_current=frame_num,
+                frame_total=total_frames,
+                step=step,
+                action=action
+            ))
+        
+        return emit_progress
+    
+    async def _prepare_frame(
+        self,
+        frame: StoryboardFrame,
+        storyboard: 'Storyboard',
+        config: StoryboardConfig,
+        emit_progress: Callable[..., None]
+    ):
+        """Steps 1-3: audio, media and composition (network-bound)"""
         # Determine if this frame needs image generation
         # If image_path or video_path is already set (e.g. asset-based pipeline), we consider it "has existing media" but skip generation
         has_existing_media = frame.image_path is not None or frame.video_path is not None
         needs_generation = frame.image_prompt is not None
         
-        try:
-            # Step 1: Generate audio (TTS)
-            if not frame.audio_path:
-                if progress_callback:
-                    progress_callback(ProgressEvent(
-                        event_type="frame_step",
-                        progress=0.0,
-                        frame_current=frame_num,
-                        frame_total=total_frames,
-                        step=1,
-                        action="audio"
-                    ))
+        needs_audio = not frame.audio_path
+        
+        # Video workflows take the TTS audio duration as target video duration,
+        # so media generation must wait for audio. Otherwise the two steps are
+        # independent and run concurrently.
+        # With estimate_video_duration the video is generated against an
+        # estimated duration instead, so both steps can still overlap.
+        media_depends_on_audio = (
+            needs_audio
+            and config.media_workflow_kind == "video"
+            and not config.estimate_video_duration
+        )
+        
+        # Step 1: Generate audio (TTS)
+        pending = []
+        if needs_audio:
+            emit_progress(0.0, 1, "audio", force=True)
+            if needs_generation and not media_depends_on_audio:
+                pending.append(asyncio.create_task(self._step_generate_audio(frame, config)))
+            else:
                 await self._step_generate_audio(frame, config)
+        else:
+            logger.debug(f"  1/4: Using existing audio: {frame.audio_path}")
+        
+        # Step 2: Generate media (image or video, conditional)
+        if needs_generation:
+            # Always reported: when audio runs concurrently, this follows the
+            # audio event immediately but is still a real step transition
+            emit_progress(0.25, 2, "media", force=True)
+            pending.append(asyncio.create_task(self._step_generate_media(frame, config)))
+            try:
+                await asyncio.gather(*pending)
+            except BaseException:
+                for task in pending:
+                    task.cancel()
+                raise
+        elif has_existing_media:
+            # Log appropriate message based on media type
+            if frame.video_path:
+                logger.debug(f"  2/4: Using existing video: {frame.video_path}")
             else:
-                logger.debug(f"  1/4: Using existing audio: {frame.audio_path}")
-            
-            # Step 2: Generate media (image or video, conditional)
-            if needs_generation:
-                if progress_callback:
-                    progress_callback(ProgressEvent(
-                        event_type="frame_step",
-                        progress=0.25,
-                        frame_current=frame_num,
-                        frame_total=total_frames,
-                        step=2,
-                        action="media"
-                    ))
-                await self._step_generate_media(frame, config)
-            elif has_existing_media:
-                # Log appropriate message based on media type
-                if frame.video_path:
-                    logger.debug(f"  2/4: Using existing video: {frame.video_path}")
-                else:
-                    logger.debug(f"  2/4: Using existing image: {frame.image_path}")
+                logger.debug(f"  2/4: Using existing image: {frame.image_path}")
+        else:
+            frame.image_path = None
+            frame.media_type = None
+            logger.debug(f"  2/4: Skipped media generation (not required by template)")
+        
+        # Step 3: Compose frame (add subtitle)
+        emit_progress(0.50 if (needs_generation or has_existing_media) else 0.33, 3, "compose")
+        await self._step_compose_frame(frame, storyboard, config)
+    
+    async def _finish_frame(
+        self,
+        frame: StoryboardFrame,
+        config: StoryboardConfig,
+        emit_progress: Callable[..., None]
+    ):
+        """Step 4: video segment (ffmpeg, CPU-bound)"""
+        has_media = frame.image_path is not None or frame.video_path is not None
+        emit_progress(0.75 if has_media else 0.67, 4, "video", force=True)
+        
+        await self._step_create_video_segment(frame, config)
+    
+    def validate(self, config: StoryboardConfig, frames: List[StoryboardFrame]) -> None:
+        """
+        Check config and frames before any TTS/media work is started
+        
+        Catches misconfigurations that would otherwise only fail mid-pipeline,
+        after paid TTS/ComfyUI calls for earlier frames.
+        
+        Args:
+            config: Storyboard configuration
+            frames: Storyboard frames to process
+        
+        Raises:
+            ValueError: If any check fails (all problems are reported together)
+        """
+        errors = []
+        
+        if config.max_frame_concurrency < 1:
+            errors.append(f"max_frame_concurrency must be >= 1, got {config.max_frame_concurrency}")
+        
+        missing_text = [f.index + 1 for f in frames if not f.audio_path and not (f.narration or "").strip()]
+        if missing_text:
+            errors.append(f"frames {missing_text} have no narration to synthesize")
+        
+        if any(not f.audio_path for f in frames) and config.tts_inference_mode != "local":
+            try:
+                self.core.tts._resolve_workflow(workflow=config.tts_workflow)
+            except ValueError as e:
+                errors.append(f"TTS: {e}")
+        
+        if any(f.image_prompt is not None for f in frames):
+            try:
+                self.core.media._resolve_workflow(workflow=config.media_workflow)
+            except ValueError as e:
+                errors.append(f"Media: {e}")
+        
+        try:
+            resolve_template_path(config.frame_template)
+        except FileNotFoundError as e:
+            errors.append(f"Template: {e}")
+        
+        if errors:
+            raise ValueError("Invalid storyboard configuration:\n- " + "\n- ".join(errors))
+        
+        logger.info(
+            f"Storyboard validated: {len(frames)} frames, "
+            f"tts={config.tts_inference_mode}, media={config.media_workflow_kind} "
+            f"({config.media_workflow or 'default'}), template={config.frame_template}"
+        )
+    
+    async def process_all(
+        self,
+        frames: List[StoryboardFrame],
+        storyboard: 'Storyboard',
+        config: StoryboardConfig,
+        progress_callback: Optional[Callable[[ProgressEvent], None]] = None,
+        max_concurrency: Optional[int] = None,
+        skip_validation: bool = False
+    ) -> List[StoryboardFrame]:
+        """
+        Process multiple frames concurrently with bounded parallelism
+        
+        Frames share no per-frame state, so their TTS/media backend calls can
+        overlap. progress_callback is invoked from the event loop thread only,
+        but events from different frames may interleave.
+        
+        Args:
+            frames: Storyboard frames to process
+            storyboard: Storyboard instance
+            config: Storyboard configuration
+            progress_callback: Optional callback for progress updates (receives ProgressEvent)
+            max_concurrency: Max frames in flight (default: config.max_frame_concurrency)
+            skip_validation: Skip validate() (when the caller already ran it)
+        
+        Returns:
+            Processed frames, in input order
+        """
+        if not skip_validation:
+            self.validate(config, frames)
+        
+        limit = max(1, max_concurrency or config.max_frame_concurrency)
+        semaphore = asyncio.Semaphore(limit)
+        total_frames = len(frames)
+        
+        logger.info(f"Processing {total_frames} frames (max {limit} concurrent)")
+        
+        async def process_one(frame: StoryboardFrame) -> StoryboardFrame:
+            async with semaphore:
+                return await self(
+                    frame=frame,
+                    storyboard=storyboard,
+                    config=config,
+                    total_frames=total_frames,
+                    progress_callback=progress_callback
+                )
+        
+        return list(await asyncio.gather(*(process_one(frame) for frame in frames)))
+    
+    async def prewarm_tts(
+        self,
+        frames: List[StoryboardFrame],
+        config: StoryboardConfig,
+        max_concurrency: int = 4,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ):
+        """
+        Generate audio for all frames up front in one TTS batch
+        
+        Frames that get audio here are treated as having existing audio by
+        __call__, so their media generation no longer overlaps TTS; only
+        used when config.prewarm_tts is set. Frames whose TTS request fails
+        are left untouched so per-frame processing generates their audio.
+        
+        Args:
+            frames: Storyboard frames
+            config: Storyboard configuration
+            max_concurrency: Max TTS requests in flight
+            progress_callback: Optional callback(completed, total), called as
+                each TTS request finishes
+        """
+        jobs = []
+        for frame in frames:
+            if frame.audio_path or not frame.narration:
+                continue
+            tts_params = self._build_tts_params(frame, config)
+            cache_key = await self._tts_cache_key(tts_params, config)
+            if cache_key and await self._load_cached_audio(frame, cache_key, tts_params["output_path"]):
+                continue
+            jobs.append((frame, tts_params, cache_key))
+        
+        if not jobs:
+            return
+        
+        logger.info(f"🎙️  Pre-generating audio for {len(jobs)} frames (max {max_concurrency} concurrent)")
+        
+        # Failed items do not cancel the others; their frames fall back to
+        # per-frame TTS while the successful results are kept and cached
+        results = await self.core.tts.batch(
+            [tts_params for _, tts_params, _ in jobs],
+            max_concurrency=max_concurrency,
+            progress_callback=progress_callback,
+            return_exceptions=True
+        )
+        
+        done = []
+        for (frame, _, cache_key), result in zip(jobs, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Batch TTS failed for frame {frame.index}, falling back to per-frame TTS: {result}")
             else:
-                frame.image_path = None
-                frame.media_type = None
-                logger.debug(f"  2/4: Skipped media generation (not required by template)")
-        
-            # Step 3: Compose frame (add subtitle)
-            if progress_callback:
-                progress_callback(ProgressEvent(
-                    event_type="frame_step",
-                    progress=0.50 if (needs_generation or has_existing_media) else 0.33,
-                    frame_current=frame_num,
-                    frame_total=total_frames,
-                    step=3,
-                    action="compose"
-                ))
-            await self._step_compose_frame(frame, storyboard, config)
-            
-            # Step 4: Create video segment
-            if progress_callback:
-                progress_callback(ProgressEvent(
-                    event_type="frame_step",
-                    progress=0.75 if (needs_generation or has_existing_media) else 0.67,
-                    frame_current=frame_num,
-                    frame_total=total_frames,
-                    step=4,
-                    action="video"
-                ))
-            
-            await self._step_create_video_segment(frame, config)
-            
-            logger.info(f"✅ Frame {frame.index} completed")
-            return frame
-
-        except Exception as e:
-            logger.error(f"❌ Failed to process frame {frame.index}: {e}")
+                done.append(self._set_frame_audio(frame, result, cache_key))
+        await asyncio.gather(*done)
+    
+    async def process_all_pipelined(
+        self,
+        frames: List[StoryboardFrame],
+        storyboard: 'Storyboard',
+        config: StoryboardConfig,
+        progress_callback: Optional[Callable[[ProgressEvent], None]] = None,
+        ffmpeg_concurrency: int = 1,
+        skip_validation: bool = False
+    ) -> List[StoryboardFrame]:
+        """
+        Process frames as a two-stage pipeline
+        
+        Stage A (audio, media, composition) runs frame by frame in order and
+        hands each frame to stage B (video segment) through a queue, so the
+        ffmpeg work for frame i overlaps the TTS/media requests of frame i+1.
+        ffmpeg_concurrency stage B workers bound the number of concurrent
+        ffmpeg processes.
+        
+        Args:
+            frames: Storyboard frames to process
+            storyboard: Storyboard instance
+            config: Storyboard configuration
+            progress_callback: Optional callback for progress updates (receives ProgressEvent)
+            ffmpeg_concurrency: Max video segments encoded concurrently
+            skip_validation: Skip validate() (when the caller already ran it)
+        
+        Returns:
+            Processed frames, in input order
+        """
+        if not skip_validation:
+            self.validate(config, frames)
+        
+        total_frames = len(frames)
+        queue: asyncio.Queue = asyncio.Queue()
+        n_workers = max(1, ffmpeg_concurrency)
+        
+        logger.info(f"Processing {total_frames} frames (pipelined, {n_workers} ffmpeg workers)")
+        
+        async def produce():
+            try:
+                for frame in frames:
+                    emit_progress = self._make_progress_emitter(frame.index + 1, total_frames, progress_callback)
+                    logger.info(f"Processing frame {frame.index}...")
+                    await self._prepare_frame(frame, storyboard, config, emit_progress)
+                    await queue.put((frame, emit_progress))
+            finally:
+                for _ in range(n_workers):
+                    await queue.put(None)
+        
+        async def consume():
+            while (item := await queue.get()) is not None:
+                frame, emit_progress = item
+                await self._finish_frame(frame, config, emit_progress)
+                logger.info(f"✅ Frame {frame.index} completed")
+        
+        tasks = [asyncio.create_task(produce())]
+        tasks += [asyncio.create_task(consume()) for _ in range(n_workers)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
             raise
+        
+        return list(frames)
     
     async def _step_generate_audio(
         self,
@@ -156,9 +500,21 @@ class FrameProcessor:
         """Step 1: Generate audio using TTS"""
         logger.debug(f"  1/4: Generating audio for frame {frame.index}...")
         
+        tts_params = self._build_tts_params(frame, config)
+        
+        # Reuse audio generated earlier for the same text and voice settings
+        cache_key = await self._tts_cache_key(tts_params, config)
+        if cache_key and await self._load_cached_audio(frame, cache_key, tts_params["output_path"]):
+            return
+        
+        audio_path = await self.core.tts(**tts_params)
+        
+        await self._set_frame_audio(frame, audio_path, cache_key)
+    
+    def _build_tts_params(self, frame: StoryboardFrame, config: StoryboardConfig) -> dict:
+        """Build TTS call parameters for a frame"""
         # Generate output path using task_id
-        from pixelle_video.utils.os_util import get_task_frame_path
-        output_path = get_task_frame_path(config.task_id, frame.index, "audio")
+        output_path = _frame_paths(config.task_id, frame.index)["audio"]
         
         # Build TTS params based on inference mode
         tts_params = {
@@ -185,13 +541,39 @@ class FrameProcessor:
             if config.ref_audio:
                 tts_params["ref_audio"] = config.ref_audio
         
-        audio_path = await self.core.tts(**tts_params)
-        
+        return tts_params
+    
+    async def _tts_cache_key(self, tts_params: dict, config: StoryboardConfig) -> Optional[str]:
+        """Cache key for TTS params (None if TTS caching is disabled)"""
+        # By default only deterministic local Edge TTS is cached
+        enabled = config.cache_tts if config.cache_tts is not None else config.tts_inference_mode == "local"
+        if not enabled:
+            return None
+        return await asyncio.to_thread(self.core.tts.cache_key, **tts_params)
+    
+    async def _load_cached_audio(self, frame: StoryboardFrame, cache_key: str, output_path: str) -> bool:
+        """Fill frame audio from cache, returns True on hit"""
+        cached = await asyncio.to_thread(load_cached_output, "tts", cache_key, output_path)
+        if cached is None:
+            return False
+        
+        frame.audio_path = output_path
+        frame.duration = cached["duration"]
+        logger.debug(f"  ✓ Audio loaded from cache: {output_path} ({frame.duration:.2f}s)")
+        return True
+    
+    async def _set_frame_audio(self, frame: StoryboardFrame, audio_path: str, cache_key: Optional[str]):
+        """Store generated audio (and its duration) on the frame"""
         frame.audio_path = audio_path
         
         # Get audio duration
         frame.duration = await self._get_audio_duration(audio_path)
         
+        if cache_key:
+            await asyncio.to_thread(
+                save_cached_output, "tts", cache_key, audio_path, {"duration": frame.duration}
+            )
+        
         logger.debug(f"  ✓ Audio generated: {audio_path} ({frame.duration:.2f}s)")
     
     async def _step_generate_media(
@@ -202,13 +584,11 @@ class FrameProcessor:
         """Step 2: Generate media (image or video) using ComfyKit"""
         logger.debug(f"  2/4: Generating media for frame {frame.index}...")
         
-        # Determine media type based on workflow
-        # video_ prefix in workflow name indicates video generation
-        workflow_name = config.media_workflow or ""
-        is_video_workflow = "video_" in workflow_name.lower()
-        media_type = "video" if is_video_workflow else "image"
+        # Media type is derived from the workflow name once per config
+        media_type = config.media_workflow_kind
+        is_video_workflow = media_type == "video"
         
-        logger.debug(f"  → Media type: {media_type} (workflow: {workflow_name})")
+        logger.debug(f"  → Media type: {media_type} (workflow: {config.media_workflow or ''})")
         
         # Build media generation parameters
         media_params = {
@@ -225,6 +605,30 @@ class FrameProcessor:
         if is_video_workflow and frame.duration:
             media_params["duration"] = frame.duration
             logger.info(f"  → Generating video with target duration: {frame.duration:.2f}s (from TTS audio)")
+        elif is_video_workflow and config.estimate_video_duration:
+            # TTS is still running: use an estimate biased long, so the segment
+            # step trims the video to the audio rather than freezing frames
+            media_params["duration"] = estimate_speech_duration(frame.narration, config.tts_speed or 1.0)
+            logger.info(f"  → Generating video with target duration: {media_params['duration']:.2f}s (estimated from narration)")
+        
+        # Reuse media generated earlier for the same prompt and workflow (opt-in)
+        cache_key = None
+        if config.cache_media:
+            cache_key = make_cache_key({
+                k: v for k, v in media_params.items() if k != "index"
+            })
+            output_path = _frame_paths(config.task_id, frame.index)[media_type]
+            cached = await asyncio.to_thread(load_cached_output, "media", cache_key, output_path)
+            if cached is not None:
+                frame.media_type = media_type
+                if media_type == "video":
+                    frame.video_path = output_path
+                    if not self._audio_owns_duration(frame, config):
+                        frame.duration = cached["duration"]
+                else:
+                    frame.image_path = output_path
+                logger.debug(f"  ✓ Media loaded from cache: {output_path}")
+                return
         
         # Call Media generation
         media_result = await self.core.media(**media_params)
@@ -253,17 +657,34 @@ class FrameProcessor:
             )
             frame.video_path = local_path
             
-            # Update duration from video if available
-            if media_result.duration:
-                frame.duration = media_result.duration
-                logger.debug(f"  ✓ Video generated: {local_path} (duration: {frame.duration:.2f}s)")
-            else:
-                # Get video duration from file
-                frame.duration = await self._get_video_duration(local_path)
-                logger.debug(f"  ✓ Video generated: {local_path} (duration: {frame.duration:.2f}s)")
+            # Use duration from video if available, otherwise read it from file
+            video_duration = media_result.duration or await self._get_video_duration(local_path)
+            logger.debug(f"  ✓ Video generated: {local_path} (duration: {video_duration:.2f}s)")
+            
+            if not self._audio_owns_duration(frame, config):
+                frame.duration = video_duration
         
         else:
             raise ValueError(f"Unknown media type: {media_result.media_type}")
+        
+        if cache_key and media_result.media_type == media_type:
+            await asyncio.to_thread(
+                save_cached_output,
+                "media",
+                cache_key,
+                local_path,
+                {"media_type": media_type, "duration": video_duration if media_type == "video" else None}
+            )
+    
+    @staticmethod
+    def _audio_owns_duration(frame: StoryboardFrame, config: StoryboardConfig) -> bool:
+        """
+        Whether the frame duration should stay the TTS audio duration
+        
+        With estimated video durations the video only approximates the
+        audio length, and the segment step fits it to the audio.
+        """
+        return config.estimate_video_duration and frame.audio_path is not None
     
     async def _step_compose_frame(
         self,
@@ -275,8 +696,7 @@ class FrameProcessor:
         logger.debug(f"  3/4: Composing frame {frame.index}...")
         
         # Generate output path using task_id
-        from pixelle_video.utils.os_util import get_task_frame_path
-        output_path = get_task_frame_path(config.task_id, frame.index, "composed")
+        output_path = _frame_paths(config.task_id, frame.index)["composed"]
         
         # For video type: render HTML as transparent overlay image
         # For image type: render HTML with image background
@@ -295,9 +715,6 @@ class FrameProcessor:
         output_path: str
     ) -> str:
         """Compose frame using HTML template"""
-        from pixelle_video.services.frame_html import HTMLFrameGenerator
-        from pixelle_video.utils.template_util import resolve_template_path
-        
         # Resolve template path (handles various input formats)
         template_path = resolve_template_path(config.frame_template)
         
@@ -314,7 +731,7 @@ class FrameProcessor:
             ext.update(config.template_params)
         
         # Generate frame using HTML (size is auto-parsed from template path)
-        generator = HTMLFrameGenerator(template_path)
+        generator = self._get_html_generator(template_path)
         
         # Use video_path for video media, image_path for images
         media_path = frame.video_path if frame.media_type == "video" else frame.image_path
@@ -330,6 +747,12 @@ class FrameProcessor:
         
         return composed_path
     
+    def _get_html_generator(self, template_path: str) -> HTMLFrameGenerator:
+        """Get the HTML frame generator for template_path, reusing it across frames"""
+        if self._html_generator is None or self._html_generator.template_path != template_path:
+            self._html_generator = HTMLFrameGenerator(template_path)
+        return self._html_generator
+    
     async def _step_create_video_segment(
         self,
         frame: StoryboardFrame,
@@ -339,49 +762,37 @@ class FrameProcessor:
         logger.debug(f"  4/4: Creating video segment for frame {frame.index}...")
         
         # Generate output path using task_id
-        from pixelle_video.utils.os_util import get_task_frame_path
-        output_path = get_task_frame_path(config.task_id, frame.index, "segment")
+        output_path = _frame_paths(config.task_id, frame.index)["segment"]
         
-        from pixelle_video.services.video import VideoService
-        video_service = VideoService()
+        video_service = self._video_service
         
         # Branch based on media type
         if frame.media_type == "video":
-            # Video workflow: overlay HTML template on video, then add audio
+            # Video workflow: overlay HTML template on video and add audio
+            # in a single ffmpeg pass (no intermediate overlay file)
             logger.debug(f"  → Using video-based composition with HTML overlay")
             
-            # Step 1: Overlay transparent HTML image on video
-            # The composed_image_path contains the rendered HTML with transparent background
-            temp_video_with_overlay = get_task_frame_path(config.task_id, frame.index, "video") + "_overlay.mp4"
-            
-            video_service.overlay_image_on_video(
+            # The composed_image_path contains the rendered HTML with transparent background.
+            # The video might have audio (replaced) or be silent (audio added).
+            # ffmpeg is blocking; run it on the ffmpeg pool so other frames keep
+            # progressing on the event loop
+            segment_path = await self._run_ffmpeg(
+                video_service.overlay_image_and_merge_audio,
                 video=frame.video_path,
                 overlay_image=frame.composed_image_path,
-                output=temp_video_with_overlay,
-                scale_mode="contain"  # Scale video to fit template size (contain mode)
-            )
-            
-            # Step 2: Add narration audio to the overlaid video
-            # Note: The video might have audio (replaced) or be silent (audio added)
-            segment_path = video_service.merge_audio_video(
-                video=temp_video_with_overlay,
                 audio=frame.audio_path,
                 output=output_path,
-                replace_audio=True,  # Replace video audio with narration
+                scale_mode="contain",  # Scale video to fit template size (contain mode)
                 audio_volume=1.0
             )
-            
-            # Clean up temp file
-            import os
-            if os.path.exists(temp_video_with_overlay):
-                os.unlink(temp_video_with_overlay)
         
         elif frame.media_type == "image" or frame.media_type is None:
             # Image workflow: Use composed image directly
             # The asset_default.html template includes the image in the composition
             logger.debug(f"  → Using image-based composition")
             
-            segment_path = video_service.create_video_from_image(
+            segment_path = await self._run_ffmpeg(
+                video_service.create_video_from_image,
                 image=frame.composed_image_path,
                 audio=frame.audio_path,
                 output=output_path,
@@ -395,18 +806,26 @@ class FrameProcessor:
         
         logger.debug(f"  ✓ Video segment created: {segment_path}")
     
+    @staticmethod
+    async def _run_ffmpeg(fn: Callable, *args, **kwargs):
+        """Run a blocking ffmpeg-bound call on the dedicated ffmpeg pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_FFMPEG_EXECUTOR, partial(fn, *args, **kwargs))
+    
     async def _get_audio_duration(self, audio_path: str) -> float:
         """Get audio duration in seconds"""
+        # Fast path: read duration from file headers (no ffprobe subprocess)
+        duration = await asyncio.to_thread(probe_audio_duration, audio_path)
+        if duration:
+            return duration
+        
         try:
-            # Try using ffmpeg-python
-            import ffmpeg
-            probe = ffmpeg.probe(audio_path)
+            probe = await asyncio.to_thread(ffmpeg.probe, audio_path)
             duration = float(probe['format']['duration'])
             return duration
         except Exception as e:
             logger.warning(f"Failed to get audio duration: {e}, using estimate")
             # Fallback: estimate based on file size (very rough)
-            import os
             file_size = os.path.getsize(audio_path)
             # Assume ~16kbps for MP3, so 2KB per second
             estimated_duration = file_size / 2000
@@ -420,24 +839,32 @@ class FrameProcessor:
         media_type: str
     ) -> str:
         """Download media (image or video) from URL to local file"""
-        from pixelle_video.utils.os_util import get_task_frame_path
-        output_path = get_task_frame_path(task_id, frame_index, media_type)
+        output_path = _frame_paths(task_id, frame_index)[media_type]
         
-        timeout = httpx.Timeout(connect=10.0, read=60, write=60, pool=60)
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(url)
+        client = self._get_client()
+        async with client.stream("GET", url) as response:
             response.raise_for_status()
             
-            with open(output_path, 'wb') as f:
-                f.write(response.content)
+            # Disk writes run in a worker thread so the event loop keeps serving
+            # other frames' network I/O
+            f = await asyncio.to_thread(open, output_path, 'wb')
+            try:
+                async for chunk in response.aiter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                    await asyncio.to_thread(f.write, chunk)
+            finally:
+                await asyncio.to_thread(f.close)
         
         return output_path
     
     async def _get_video_duration(self, video_path: str) -> float:
         """Get video duration in seconds"""
+        # Fast path: read duration from the mvhd atom (no ffprobe subprocess)
+        duration = await asyncio.to_thread(probe_video_duration, video_path)
+        if duration:
+            return duration
+        
         try:
-            import ffmpeg
-            probe = ffmpeg.probe(video_path)
+            probe = await asyncio.to_thread(ffmpeg.probe, video_path)
             duration = float(probe['format']['duration'])
             return duration
         except Exception as e:
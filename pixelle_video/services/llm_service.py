@@ -124,6 +124,7 @@ class LLMService:
         temperature: float = 0.7,
         max_tokens: int = 2000,
         response_type: Optional[Type[T]] = None,
+        system_prompt: Optional[str] = None,
         **kwargs
     ) -> Union[str, T]:
         """
@@ -138,6 +139,9 @@ class LLMService:
             max_tokens: Maximum tokens to generate
             response_type: Optional Pydantic model class for structured output.
                           If provided, returns parsed model instance instead of string.
+            system_prompt: Optional static system message sent before the prompt.
+                          Keeping it identical across calls lets providers reuse
+                          their prompt prefix cache.
             **kwargs: Additional provider-specific parameters
         
         Returns:
@@ -181,13 +185,14 @@ class LLMService:
                     response_type=response_type,
                     temperature=temperature,
                     max_tokens=max_tokens,
+                    system_prompt=system_prompt,
                     **kwargs
                 )
             else:
                 # Standard text output mode
                 response = await client.chat.completions.create(
                     model=final_model,
-                    messages=[{"role": "user", "content": prompt}],
+                    messages=self._build_messages(prompt, system_prompt),
                     temperature=temperature,
                     max_tokens=max_tokens,
                     **kwargs
@@ -210,6 +215,7 @@ class LLMService:
         response_type: Type[T],
         temperature: float,
         max_tokens: int,
+        system_prompt: Optional[str] = None,
         **kwargs
     ) -> T:
         """
@@ -225,6 +231,7 @@ class LLMService:
             response_type: Pydantic model class
             temperature: Sampling temperature
             max_tokens: Max tokens
+            system_prompt: Optional static system message
             **kwargs: Additional parameters
         
         Returns:
@@ -237,7 +244,7 @@ class LLMService:
         # Call LLM with enhanced prompt
         response = await client.chat.completions.create(
             model=model,
-            messages=[{"role": "user", "content": enhanced_prompt}],
+            messages=self._build_messages(enhanced_prompt, system_prompt),
             temperature=temperature,
             max_tokens=max_tokens,
             **kwargs
@@ -249,6 +256,24 @@ class LLMService:
         # Parse JSON from response content
         return self._parse_response_as_model(content, response_type)
     
+    @staticmethod
+    def _build_messages(prompt: str, system_prompt: Optional[str] = None) -> list:
+        """
+        Build chat messages, putting the static system prompt first
+        
+        Args:
+            prompt: User prompt (dynamic part)
+            system_prompt: Optional system prompt (static part)
+        
+        Returns:
+            List of chat message dicts
+        """
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        return messages
+    
     def _get_json_schema_instruction(self, response_type: Type[T]) -> str:
         """
         Generate JSON schema instruction for LLM fallback mode
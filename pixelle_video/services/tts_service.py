@@ -14,19 +14,54 @@
 TTS (Text-to-Speech) Service - Supports both local and ComfyUI inference
 """
 
+import asyncio
 import os
 import uuid
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from comfykit import ComfyKit
 from loguru import logger
 
 from pixelle_video.services.comfy_base_service import ComfyBaseService
+from pixelle_video.utils.generation_cache import file_fingerprint, make_cache_key
 from pixelle_video.utils.tts_util import edge_tts
 from pixelle_video.tts_voices import speed_to_rate
 
 
+# Result attributes reported when a workflow returns no audio
+_RESULT_DEBUG_ATTRS = ("audios", "files", "outputs", "status", "msg")
+
+# Output file extensions recognized as audio in raw workflow outputs
+_AUDIO_EXTENSIONS = (".mp3", ".wav", ".flac")
+
+
+def _first_audio(result) -> Optional[str]:
+    """
+    Get the generated audio path from a ComfyKit result
+    
+    Checks result.audios, then result.files, then string values in
+    result.outputs that end with an audio extension.
+    
+    Returns:
+        Audio path or URL, or None if the workflow returned none
+    """
+    for attr in ("audios", "files"):
+        values = getattr(result, attr, None)
+        if values:
+            logger.debug(f"✅ Found audio in result.{attr}: {values[0]}")
+            return values[0]
+    
+    outputs = getattr(result, "outputs", None)
+    if outputs:
+        logger.opt(lazy=True).debug("Searching for audio file in result.outputs: {}", lambda: outputs)
+        for key, value in outputs.items():
+            if isinstance(value, str) and value.endswith(_AUDIO_EXTENSIONS):
+                logger.debug(f"✅ Found audio in result.outputs[{key}]: {value}")
+                return value
+    return None
+
+
 class TTSService(ComfyBaseService):
     """
     TTS (Text-to-Speech) service - Workflow-based
@@ -138,6 +173,123 @@ class TTSService(ComfyBaseService):
                 **params
             )
     
+    async def batch(
+        self,
+        items: List[Dict[str, Any]],
+        max_concurrency: int = 4,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        return_exceptions: bool = False
+    ) -> List[Any]:
+        """
+        Generate speech for multiple texts
+        
+        Neither Edge TTS nor ComfyUI workflows accept several texts per
+        request, so items are submitted concurrently (bounded by
+        max_concurrency) to overlap per-request latency. If any item fails,
+        the remaining ones are cancelled and the error is raised, unless
+        return_exceptions is set.
+        
+        Args:
+            items: Keyword arguments for each __call__ (must include "text")
+            max_concurrency: Max requests in flight
+            progress_callback: Optional callback(completed, total), called
+                after each item finishes
+            return_exceptions: Let every item run to completion and return
+                failures as exception objects in place of their paths
+        
+        Returns:
+            Generated audio file paths (or exceptions), in input order
+        
+        Examples:
+            audio_paths = await pixelle_video.tts.batch([
+                {"text": "Hello", "output_path": "output/1.mp3"},
+                {"text": "World", "output_path": "output/2.mp3"},
+            ])
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        completed = 0
+        
+        async def run_one(item: Dict[str, Any]) -> str:
+            async with semaphore:
+                return await self(**item)
+        
+        # Failed items count as finished too; cancelled ones do not
+        def report_done(task: asyncio.Task):
+            nonlocal completed
+            if task.cancelled():
+                return
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, len(items))
+        
+        tasks = [asyncio.create_task(run_one(item)) for item in items]
+        for task in tasks:
+            task.add_done_callback(report_done)
+        try:
+            return list(await asyncio.gather(*tasks, return_exceptions=return_exceptions))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+    
+    def cache_key(
+        self,
+        text: str,
+        workflow: Optional[str] = None,
+        voice: Optional[str] = None,
+        speed: Optional[float] = None,
+        inference_mode: Optional[str] = None,
+        ref_audio: Optional[str] = None,
+        **params
+    ) -> Optional[str]:
+        """
+        Cache key for the audio a __call__ with these arguments would produce
+        
+        The key is built from the values actually used rather than the raw
+        arguments: config defaults for voice, speed and workflow are filled
+        in, and the workflow file and ref_audio are keyed by content, so
+        config or workflow edits never hit stale cache entries.
+        Blocking (hashes files); call via asyncio.to_thread from async code.
+        
+        Args:
+            text, workflow, voice, speed, inference_mode, ref_audio, **params:
+                Same as __call__ (output_path and index are ignored)
+        
+        Returns:
+            Cache key, or None if the workflow cannot be resolved
+        """
+        params.pop("output_path", None)
+        params.pop("index", None)
+        mode = inference_mode or self.config.get("inference_mode", "local")
+        
+        if mode == "local":
+            final_voice, final_speed = self._resolve_local_voice(voice, speed)
+            return make_cache_key({
+                "text": text, "inference_mode": mode, "voice": final_voice, "speed": final_speed
+            })
+        
+        try:
+            workflow_info = self._resolve_workflow(workflow=workflow)
+        except ValueError:
+            return None
+        return make_cache_key({
+            **params,
+            "text": text,
+            "inference_mode": mode,
+            "workflow": workflow_info["key"],
+            "workflow_version": file_fingerprint(workflow_info["path"]),
+            "voice": voice,
+            "speed": speed,
+            "ref_audio": ref_audio and (file_fingerprint(ref_audio) or ref_audio),
+        })
+    
+    def _resolve_local_voice(self, voice: Optional[str], speed: Optional[float]) -> tuple:
+        """Voice and speed used by local TTS (param > config)"""
+        local_config = self.config.get("local", {})
+        final_voice = voice or local_config.get("voice", "zh-CN-YunjianNeural")
+        final_speed = speed if speed is not None else local_config.get("speed", 1.2)
+        return final_voice, final_speed
+    
     async def _call_local_tts(
         self,
         text: str,
@@ -157,12 +309,7 @@ class TTSService(ComfyBaseService):
         Returns:
             Generated audio file path
         """
-        # Get config defaults
-        local_config = self.config.get("local", {})
-        
-        # Determine voice and speed (param > config)
-        final_voice = voice or local_config.get("voice", "zh-CN-YunjianNeural")
-        final_speed = speed if speed is not None else local_config.get("speed", 1.2)
+        final_voice, final_speed = self._resolve_local_voice(voice, speed)
         
         # Convert speed to rate parameter
         rate = speed_to_rate(final_speed)
@@ -261,34 +408,15 @@ class TTSService(ComfyBaseService):
                 raise Exception(f"TTS generation failed: {error_msg}")
             
             # ComfyKit result can have audio files in different output types
-            # Try to get audio file path from result
-            audio_path = None
-            
-            # Check for audio files in result.audios (if available)
-            if hasattr(result, 'audios') and result.audios:
-                audio_path = result.audios[0]
-                logger.debug(f"✅ Found audio in result.audios: {audio_path}")
-            # Check for files in result.files
-            elif hasattr(result, 'files') and result.files:
-                audio_path = result.files[0]
-                logger.debug(f"✅ Found audio in result.files: {audio_path}")
-            # Check in outputs dictionary
-            elif hasattr(result, 'outputs') and result.outputs:
-                logger.debug(f"Searching for audio file in result.outputs: {result.outputs}")
-                # Try to find audio file in outputs
-                for key, value in result.outputs.items():
-                    if isinstance(value, str) and any(value.endswith(ext) for ext in ['.mp3', '.wav', '.flac']):
-                        audio_path = value
-                        logger.debug(f"✅ Found audio in result.outputs[{key}]: {audio_path}")
-                        break
+            audio_path = _first_audio(result)
             
             if not audio_path:
                 logger.error("No audio file generated")
                 logger.error(f"❌ Result analysis:")
-                logger.error(f"   - result.audios: {getattr(result, 'audios', 'NOT_FOUND')}")
-                logger.error(f"   - result.files: {getattr(result, 'files', 'NOT_FOUND')}")
-                logger.error(f"   - result.outputs: {getattr(result, 'outputs', 'NOT_FOUND')}")
-                logger.error(f"   - Full __dict__: {result.__dict__}")
+                for attr in _RESULT_DEBUG_ATTRS:
+                    logger.error(f"   - result.{attr}: {getattr(result, attr, 'NOT_FOUND')}")
+                # The full object can be large; only format it when DEBUG is enabled
+                logger.opt(lazy=True).debug("   - Full __dict__: {}", lambda: vars(result))
                 raise Exception("No audio file generated by workflow")
             
             # If output_path provided and audio_path is URL, download to local
@@ -304,8 +432,8 @@ class TTSService(ComfyBaseService):
                     response = await client.get(audio_path)
                     response.raise_for_status()
                     
-                    with open(output_path, 'wb') as f:
-                        f.write(response.content)
+                    # Write from a worker thread so concurrent TTS jobs keep running
+                    await asyncio.to_thread(Path(output_path).write_bytes, response.content)
                 
                 logger.info(f"✅ Generated audio (ComfyUI): {output_path}")
                 return output_path
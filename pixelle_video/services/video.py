@@ -34,8 +34,10 @@ from typing import List, Literal, Optional
 import ffmpeg
 from loguru import logger
 
+from pixelle_video.utils.media_probe import probe_audio_duration, probe_video_duration
 from pixelle_video.utils.os_util import (
     get_resource_path,
+    link_or_copy,
     list_resource_files,
     resource_exists
 )
@@ -143,8 +145,8 @@ class VideoService:
             raise ValueError("Videos list cannot be empty")
         
         if len(videos) == 1:
-            logger.info(f"Only one video provided, copying to {output}")
-            shutil.copy(videos[0], output)
+            logger.info(f"Only one video provided, linking to {output}")
+            link_or_copy(videos[0], output)
             return output
         
         logger.info(f"Concatenating {len(videos)} videos using {method} method")
@@ -265,6 +267,10 @@ class VideoService:
     
     def _get_video_duration(self, video: str) -> float:
         """Get video duration in seconds"""
+        duration = probe_video_duration(video)
+        if duration:
+            return duration
+        
         try:
             probe = ffmpeg.probe(video)
             duration = float(probe['format']['duration'])
@@ -275,6 +281,10 @@ class VideoService:
     
     def _get_audio_duration(self, audio: str) -> float:
         """Get audio duration in seconds"""
+        duration = probe_audio_duration(audio)
+        if duration:
+            return duration
+        
         try:
             probe = ffmpeg.probe(audio)
             duration = float(probe['format']['duration'])
@@ -554,39 +564,7 @@ class VideoService:
         logger.info(f"Overlaying image on video (scale_mode={scale_mode})")
         
         try:
-            # Get overlay image dimensions
-            overlay_probe = ffmpeg.probe(overlay_image)
-            overlay_stream = next(s for s in overlay_probe['streams'] if s['codec_type'] == 'video')
-            overlay_width = int(overlay_stream['width'])
-            overlay_height = int(overlay_stream['height'])
-            
-            logger.debug(f"Overlay dimensions: {overlay_width}x{overlay_height}")
-            
-            input_video = ffmpeg.input(video)
-            input_overlay = ffmpeg.input(overlay_image)
-            
-            # Scale video to fit overlay size using scale_mode
-            if scale_mode == "contain":
-                # Scale to fit (letterbox/pillarbox if aspect ratio differs)
-                # Use scale filter with force_original_aspect_ratio=decrease and pad to center
-                scaled_video = (
-                    input_video
-                    .filter('scale', overlay_width, overlay_height, force_original_aspect_ratio='decrease')
-                    .filter('pad', overlay_width, overlay_height, '(ow-iw)/2', '(oh-ih)/2', color='black')
-                )
-            elif scale_mode == "cover":
-                # Scale to cover (crop if aspect ratio differs)
-                scaled_video = (
-                    input_video
-                    .filter('scale', overlay_width, overlay_height, force_original_aspect_ratio='increase')
-                    .filter('crop', overlay_width, overlay_height)
-                )
-            else:  # stretch
-                # Stretch to exact dimensions
-                scaled_video = input_video.filter('scale', overlay_width, overlay_height)
-            
-            # Overlay the transparent image on top of the scaled video
-            output_stream = ffmpeg.overlay(scaled_video, input_overlay)
+            output_stream = self._build_overlay_stream(video, overlay_image, scale_mode)
             
             (
                 ffmpeg
@@ -606,6 +584,142 @@ class VideoService:
             logger.error(f"FFmpeg overlay error: {error_msg}")
             raise RuntimeError(f"Failed to overlay image on video: {error_msg}")
     
+    def overlay_image_and_merge_audio(
+        self,
+        video: str,
+        overlay_image: str,
+        audio: str,
+        output: str,
+        scale_mode: str = "contain",
+        audio_volume: float = 1.0,
+        pad_strategy: str = "freeze",
+        duration_tolerance: float = 0.3,
+    ) -> str:
+        """
+        Overlay a transparent image on video and replace its audio in one ffmpeg pass
+        
+        Equivalent to overlay_image_on_video() followed by
+        merge_audio_video(replace_audio=True), but the video is decoded and
+        encoded only once and no intermediate file is written.
+        
+        Args:
+            video: Base video file path
+            overlay_image: Transparent overlay image path
+            audio: Audio file path (replaces any audio in the video)
+            output: Output video file path
+            scale_mode: How to scale the base video to the overlay size
+                        ("contain", "cover" or "stretch", see overlay_image_on_video)
+            audio_volume: Volume of the new audio (0.0 to 1.0+)
+            pad_strategy: How to pad video shorter than audio
+                         - "freeze": Freeze last frame (default)
+                         - "black": Fill with black screen
+            duration_tolerance: Video longer than audio by more than this many
+                                seconds is trimmed to the audio duration
+        
+        Returns:
+            Path to the output video file
+        
+        Raises:
+            RuntimeError: If FFmpeg execution fails
+        """
+        video_duration = self._get_video_duration(video)
+        audio_duration = self._get_audio_duration(audio)
+        
+        logger.info(
+            f"Overlaying image and merging audio (scale_mode={scale_mode}): "
+            f"video={video_duration:.2f}s, audio={audio_duration:.2f}s"
+        )
+        
+        try:
+            video_stream = self._build_overlay_stream(video, overlay_image, scale_mode)
+            audio_stream = ffmpeg.input(audio).audio.filter('volume', audio_volume)
+            output_kwargs = {}
+            
+            diff = video_duration - audio_duration
+            if diff < 0:
+                # Video shorter than audio → pad video to avoid black screen
+                logger.info(f"Audio is longer, padding video by {-diff:.2f}s using '{pad_strategy}' strategy")
+                stop_mode = 'clone' if pad_strategy == "freeze" else 'add'
+                video_stream = video_stream.filter('tpad', stop_mode=stop_mode, stop_duration=-diff)
+            elif diff > duration_tolerance:
+                # Video significantly longer than audio → trim to audio
+                logger.info(f"Video is longer by {diff:.2f}s, trimming to {audio_duration:.2f}s")
+                output_kwargs['t'] = audio_duration
+            elif diff > 0:
+                # Within tolerance → keep video, pad audio with silence
+                audio_stream = audio_stream.filter('apad', whole_dur=video_duration)
+            
+            (
+                ffmpeg
+                .output(
+                    video_stream,
+                    audio_stream,
+                    output,
+                    vcodec='libx264',
+                    pix_fmt='yuv420p',
+                    preset='medium',
+                    crf=23,
+                    acodec='aac',
+                    audio_bitrate='192k',
+                    **output_kwargs
+                )
+                .overwrite_output()
+                .run(capture_stdout=True, capture_stderr=True)
+            )
+            
+            logger.success(f"Image overlaid and audio merged: {output}")
+            return output
+        except ffmpeg.Error as e:
+            error_msg = e.stderr.decode() if e.stderr else str(e)
+            logger.error(f"FFmpeg overlay/merge error: {error_msg}")
+            raise RuntimeError(f"Failed to overlay image and merge audio: {error_msg}")
+    
+    def _build_overlay_stream(self, video: str, overlay_image: str, scale_mode: str):
+        """
+        Build the ffmpeg stream of video scaled to the overlay size with the overlay on top
+        
+        Args:
+            video: Base video file path
+            overlay_image: Transparent overlay image path
+            scale_mode: "contain", "cover" or "stretch"
+        
+        Returns:
+            ffmpeg-python video stream
+        """
+        # Get overlay image dimensions
+        overlay_probe = ffmpeg.probe(overlay_image)
+        overlay_stream = next(s for s in overlay_probe['streams'] if s['codec_type'] == 'video')
+        overlay_width = int(overlay_stream['width'])
+        overlay_height = int(overlay_stream['height'])
+        
+        logger.debug(f"Overlay dimensions: {overlay_width}x{overlay_height}")
+        
+        input_video = ffmpeg.input(video)
+        input_overlay = ffmpeg.input(overlay_image)
+        
+        # Scale video to fit overlay size using scale_mode
+        if scale_mode == "contain":
+            # Scale to fit (letterbox/pillarbox if aspect ratio differs)
+            # Use scale filter with force_original_aspect_ratio=decrease and pad to center
+            scaled_video = (
+                input_video
+                .filter('scale', overlay_width, overlay_height, force_original_aspect_ratio='decrease')
+                .filter('pad', overlay_width, overlay_height, '(ow-iw)/2', '(oh-ih)/2', color='black')
+            )
+        elif scale_mode == "cover":
+            # Scale to cover (crop if aspect ratio differs)
+            scaled_video = (
+                input_video
+                .filter('scale', overlay_width, overlay_height, force_original_aspect_ratio='increase')
+                .filter('crop', overlay_width, overlay_height)
+            )
+        else:  # stretch
+            # Stretch to exact dimensions
+            scaled_video = input_video.filter('scale', overlay_width, overlay_height)
+        
+        # Overlay the transparent image on top of the scaled video
+        return ffmpeg.overlay(scaled_video, input_overlay)
+    
     def create_video_from_image(
         self,
         image: str,
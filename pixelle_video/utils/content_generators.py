@@ -393,7 +393,7 @@ async def generate_video_prompts(
     Returns:
         List of video prompts (base prompts, without prefix applied)
     """
-    from pixelle_video.prompts.video_generation import build_video_prompt_prompt
+    from pixelle_video.prompts.video_generation import build_video_prompt_messages
     
     logger.info(f"Generating video prompts for {len(narrations)} narrations (batch_size={batch_size})")
     
@@ -411,7 +411,7 @@ async def generate_video_prompts(
         for attempt in range(1, max_retries + 1):
             try:
                 # Generate prompts for this batch
-                prompt = build_video_prompt_prompt(
+                system_prompt, prompt = build_video_prompt_messages(
                     narrations=batch_narrations,
                     min_words=min_words,
                     max_words=max_words
@@ -419,6 +419,7 @@ async def generate_video_prompts(
                 
                 response = await llm_service(
                     prompt=prompt,
+                    system_prompt=system_prompt,
                     temperature=0.7,
                     max_tokens=8192
                 )
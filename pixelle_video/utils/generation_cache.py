@@ -0,0 +1,213 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Content-addressed cache for generated assets (TTS audio, media)
+
+Generated files are stored under data/cache/<kind>/<key><ext> together with
+a <key>.json sidecar holding metadata (e.g. duration), where key is a hash
+of the generation parameters. Each namespace is kept under CACHE_MAX_BYTES
+and CACHE_MAX_AGE: entries are evicted least recently used first. Functions
+here do blocking file I/O; call them via asyncio.to_thread from async code.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from pixelle_video.utils.os_util import get_cache_path
+
+# Per-namespace limits; least recently used entries are evicted first
+CACHE_MAX_BYTES = 2 * 1024 ** 3
+CACHE_MAX_AGE = 30 * 24 * 3600.0
+
+# A namespace is pruned at most this often (seconds) by save_cached_output
+_PRUNE_INTERVAL = 600.0
+_last_prune: Dict[str, float] = {}
+
+
+def make_cache_key(params: Dict[str, Any]) -> str:
+    """
+    Hash generation parameters into a cache key
+    
+    Args:
+        params: JSON-serializable generation parameters
+    
+    Returns:
+        32-char hex digest
+    """
+    payload = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def file_fingerprint(path: str) -> Optional[str]:
+    """
+    Content hash of a local file, for use in cache keys
+    
+    Hashes are memoized per (path, mtime, size), so unchanged files are
+    only read once per process.
+    
+    Args:
+        path: Local file path
+    
+    Returns:
+        32-char hex digest, or None if path is not a readable local file
+    """
+    try:
+        st = os.stat(path)
+        return _hash_file(path, st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=64)
+def _hash_file(path: str, mtime_ns: int, size: int) -> str:
+    """Hash one version of a file (see file_fingerprint)"""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def load_cached_output(kind: str, key: str, output_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Copy a cached asset to output_path if present
+    
+    Args:
+        kind: Cache namespace (e.g. "tts", "media")
+        key: Cache key from make_cache_key()
+        output_path: Destination path (its extension selects the cached file)
+    
+    Returns:
+        Cached metadata dict on hit, None on miss
+    """
+    ext = os.path.splitext(output_path)[1]
+    cached_file = get_cache_path(kind, f"{key}{ext}")
+    meta_file = get_cache_path(kind, f"{key}.json")
+    
+    if not (os.path.exists(cached_file) and os.path.exists(meta_file)):
+        return None
+    
+    try:
+        with open(meta_file, "r", encoding="utf-8") as f:
+            metadata = json.load(f)
+        
+        # Copy rather than hardlink: generators write their outputs in place,
+        # which would silently corrupt a linked cache entry
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        shutil.copyfile(cached_file, output_path)
+        
+        # The sidecar mtime records the last use, for LRU eviction
+        os.utime(meta_file)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable {kind} cache entry {key}: {e}")
+        return None
+    
+    return metadata
+
+
+def save_cached_output(kind: str, key: str, source_path: str, metadata: Dict[str, Any]) -> None:
+    """
+    Store a generated asset in the cache
+    
+    Failures are logged and otherwise ignored; caching is best-effort.
+    
+    Args:
+        kind: Cache namespace (e.g. "tts", "media")
+        key: Cache key from make_cache_key()
+        source_path: Local path of the generated asset
+        metadata: JSON-serializable metadata to store with the asset
+    """
+    if not os.path.isfile(source_path):
+        return
+    
+    ext = os.path.splitext(source_path)[1]
+    cached_file = get_cache_path(kind, f"{key}{ext}")
+    meta_file = get_cache_path(kind, f"{key}.json")
+    
+    try:
+        # Write to temp names, then rename, so readers never see partial files
+        shutil.copyfile(source_path, cached_file + ".tmp")
+        os.replace(cached_file + ".tmp", cached_file)
+        with open(meta_file + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(metadata, f, ensure_ascii=False)
+        os.replace(meta_file + ".tmp", meta_file)
+    except OSError as e:
+        logger.warning(f"Failed to cache {kind} output {source_path}: {e}")
+        return
+    
+    now = time.monotonic()
+    if now - _last_prune.get(kind, float("-inf")) >= _PRUNE_INTERVAL:
+        _last_prune[kind] = now
+        prune_cache(kind)
+
+
+def prune_cache(
+    kind: str,
+    max_bytes: int = CACHE_MAX_BYTES,
+    max_age: float = CACHE_MAX_AGE
+) -> int:
+    """
+    Evict cache entries unused for max_age, then the least recently used
+    ones until the namespace holds at most max_bytes
+    
+    Args:
+        kind: Cache namespace (e.g. "tts", "media")
+        max_bytes: Size limit for the namespace
+        max_age: Max seconds since an entry was last stored or loaded
+    
+    Returns:
+        Number of entries removed
+    """
+    cache_dir = get_cache_path(kind)
+    
+    # key -> [last_used, total_bytes, paths]
+    entries: Dict[str, list] = {}
+    try:
+        with os.scandir(cache_dir) as it:
+            for de in it:
+                if not de.is_file():
+                    continue
+                key = de.name.split(".", 1)[0]
+                st = de.stat()
+                entry = entries.setdefault(key, [0.0, 0, []])
+                entry[0] = max(entry[0], st.st_mtime)
+                entry[1] += st.st_size
+                entry[2].append(de.path)
+    except OSError as e:
+        logger.warning(f"Failed to scan {kind} cache: {e}")
+        return 0
+    
+    cutoff = time.time() - max_age
+    total = sum(entry[1] for entry in entries.values())
+    removed = 0
+    for last_used, size, paths in sorted(entries.values(), key=lambda entry: entry[0]):
+        if last_used >= cutoff and total <= max_bytes:
+            break
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        total -= size
+        removed += 1
+    
+    if removed:
+        logger.info(f"Pruned {removed} {kind} cache entries")
+    return removed
@@ -0,0 +1,236 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Lightweight media probing utilities
+
+Read audio/video duration from file headers without spawning ffprobe.
+Every function returns None when the format is not recognized, so callers
+can fall back to ffmpeg.probe.
+"""
+
+import os
+import struct
+import wave
+from typing import Optional
+
+# MPEG audio Layer III bitrate tables (kbps), indexed by bitrate index
+_MP3_BITRATES_V1 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+_MP3_BITRATES_V2 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+
+# Sample rates (Hz), indexed by MPEG version bits then sample rate index
+_MP3_SAMPLE_RATES = {
+    0b11: (44100, 48000, 32000),  # MPEG 1
+    0b10: (22050, 24000, 16000),  # MPEG 2
+    0b00: (11025, 12000, 8000),   # MPEG 2.5
+}
+
+# Bytes scanned for the first MPEG frame sync after the ID3v2 tag
+_MP3_SYNC_SCAN_BYTES = 64 * 1024
+
+
+def probe_audio_duration(audio_path: str) -> Optional[float]:
+    """
+    Get audio duration from file headers (WAV and MP3)
+
+    Args:
+        audio_path: Path to audio file
+
+    Returns:
+        Duration in seconds, or None if the format is not supported
+    """
+    ext = os.path.splitext(audio_path)[1].lower()
+    try:
+        if ext == ".wav":
+            return _wav_duration(audio_path)
+        if ext == ".mp3":
+            return _mp3_duration(audio_path)
+    except (OSError, EOFError, wave.Error, struct.error, IndexError, ValueError):
+        return None
+    return None
+
+
+def _wav_duration(path: str) -> Optional[float]:
+    """Duration of a PCM WAV file"""
+    with wave.open(path, "rb") as w:
+        rate = w.getframerate()
+        if rate <= 0:
+            return None
+        return w.getnframes() / rate
+
+
+def _mp3_duration(path: str) -> Optional[float]:
+    """
+    Duration of an MP3 file
+
+    Uses the Xing/Info or VBRI frame count when present, otherwise assumes
+    constant bitrate and derives the duration from the audio payload size.
+    """
+    file_size = os.path.getsize(path)
+
+    with open(path, "rb") as f:
+        head = f.read(10)
+        audio_start = 0
+        if head[:3] == b"ID3" and len(head) == 10:
+            # ID3v2 size is a 28-bit synchsafe integer
+            tag_size = (head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9]
+            audio_start = 10 + tag_size + (10 if head[5] & 0x10 else 0)
+
+        f.seek(audio_start)
+        data = f.read(_MP3_SYNC_SCAN_BYTES)
+
+        # Subtract a trailing ID3v1 tag if present
+        audio_end = file_size
+        if file_size >= 128:
+            f.seek(file_size - 128)
+            if f.read(3) == b"TAG":
+                audio_end -= 128
+
+    offset = _find_mp3_frame(data)
+    if offset is None:
+        return None
+
+    header = struct.unpack(">I", data[offset:offset + 4])[0]
+    version = (header >> 19) & 0b11
+    bitrate_index = (header >> 12) & 0xF
+    sample_rate_index = (header >> 10) & 0b11
+    channel_mode = (header >> 6) & 0b11
+
+    sample_rate = _MP3_SAMPLE_RATES[version][sample_rate_index]
+    is_mpeg1 = version == 0b11
+    samples_per_frame = 1152 if is_mpeg1 else 576
+
+    # Xing/Info header sits right after the side information
+    mono = channel_mode == 0b11
+    side_info = (17 if mono else 32) if is_mpeg1 else (9 if mono else 17)
+    xing = offset + 4 + side_info
+    if data[xing:xing + 4] in (b"Xing", b"Info"):
+        flags = struct.unpack(">I", data[xing + 4:xing + 8])[0]
+        if flags & 0x1:
+            n_frames = struct.unpack(">I", data[xing + 8:xing + 12])[0]
+            if n_frames:
+                return n_frames * samples_per_frame / sample_rate
+
+    # VBRI header is always 32 bytes after the frame header
+    vbri = offset + 4 + 32
+    if data[vbri:vbri + 4] == b"VBRI":
+        n_frames = struct.unpack(">I", data[vbri + 14:vbri + 18])[0]
+        if n_frames:
+            return n_frames * samples_per_frame / sample_rate
+
+    bitrates = _MP3_BITRATES_V1 if is_mpeg1 else _MP3_BITRATES_V2
+    bitrate = bitrates[bitrate_index] * 1000
+    if not bitrate:
+        return None
+
+    audio_bytes = audio_end - (audio_start + offset)
+    return audio_bytes * 8 / bitrate
+
+
+def _find_mp3_frame(data: bytes) -> Optional[int]:
+    """Offset of the first valid MPEG audio Layer III frame header in data"""
+    offset = data.find(b"\xff")
+    while 0 <= offset <= len(data) - 4:
+        b1, b2 = data[offset + 1], data[offset + 2]
+        if (
+            (b1 & 0xE0) == 0xE0             # frame sync
+            and ((b1 >> 3) & 0b11) != 0b01  # valid MPEG version
+            and ((b1 >> 1) & 0b11) == 0b01  # Layer III
+            and 0 < (b2 >> 4) < 0xF         # valid bitrate index
+            and ((b2 >> 2) & 0b11) != 0b11  # valid sample rate index
+        ):
+            return offset
+        offset = data.find(b"\xff", offset + 1)
+    return None
+
+
+# Top-level MP4 atoms scanned for "moov" (anything else is skipped by size)
+_MP4_MAX_ATOMS = 64
+
+
+def probe_video_duration(video_path: str) -> Optional[float]:
+    """
+    Get video duration from file headers (MP4/MOV)
+
+    Args:
+        video_path: Path to video file
+
+    Returns:
+        Duration in seconds, or None if the format is not supported
+    """
+    ext = os.path.splitext(video_path)[1].lower()
+    try:
+        if ext in (".mp4", ".m4v", ".mov"):
+            return _mp4_duration(video_path)
+    except (OSError, struct.error, IndexError, ValueError):
+        return None
+    return None
+
+
+def _mp4_duration(path: str) -> Optional[float]:
+    """
+    Duration of an MP4 file from the moov/mvhd atom
+
+    Only atom headers are read; mdat payloads are skipped with seek, so the
+    cost is the same whether moov is placed before or after the media data.
+    """
+    file_size = os.path.getsize(path)
+
+    with open(path, "rb") as f:
+        moov_end = _find_mp4_atom(f, b"moov", 0, file_size)
+        if moov_end is None:
+            return None
+        if _find_mp4_atom(f, b"mvhd", f.tell(), moov_end) is None:
+            return None
+
+        # The mvhd payload may be cut off in truncated files
+        version_flags = f.read(4)
+        if len(version_flags) < 4:
+            return None
+        if version_flags[0] == 1:
+            # creation/modification times are 64-bit in version 1
+            f.seek(16, os.SEEK_CUR)
+            timescale, duration = struct.unpack(">IQ", f.read(12))
+        else:
+            f.seek(8, os.SEEK_CUR)
+            timescale, duration = struct.unpack(">II", f.read(8))
+
+    if not timescale:
+        return None
+    return duration / timescale
+
+
+def _find_mp4_atom(f, name: bytes, start: int, end: int) -> Optional[int]:
+    """
+    Seek f to the payload of the first atom called name within [start, end)
+
+    Returns the atom's end offset, or None if not found.
+    """
+    offset = start
+    for _ in range(_MP4_MAX_ATOMS):
+        if offset + 8 > end:
+            return None
+        f.seek(offset)
+        size, kind = struct.unpack(">I4s", f.read(8))
+        header = 8
+        if size == 1:
+            size = struct.unpack(">Q", f.read(8))[0]
+            header = 16
+        elif size == 0:
+            size = end - offset
+        if size < header:
+            return None
+        if kind == name:
+            f.seek(offset + header)
+            return offset + size
+        offset += size
+    return None
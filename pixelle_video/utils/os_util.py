@@ -19,9 +19,10 @@ Inspired by Pixelle-MCP's os_util.py.
 
 import os
 import random
+import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple, Literal
+from typing import Dict, Optional, Tuple, Literal
 
 
 def get_pixelle_video_root_path() -> str:
@@ -157,6 +158,30 @@ def get_output_path(*paths: str) -> str:
     return output_path
 
 
+def get_cache_path(*paths: str) -> str:
+    """
+    Get path relative to Pixelle-Video cache folder (inside data folder)
+
+    Ensures the parent directory of the returned path exists.
+    
+    Args:
+        *paths: Path components to join
+    
+    Returns:
+        Absolute path to cache directory or file
+    
+    Example:
+        get_cache_path("tts", "ab12cd.mp3")
+        # Returns: "/path/to/project/data/cache/tts/ab12cd.mp3"
+    """
+    cache_path = get_data_path("cache", *paths)
+    
+    # Ensure parent directory exists
+    os.makedirs(os.path.dirname(cache_path) if paths else cache_path, exist_ok=True)
+    
+    return cache_path
+
+
 def save_bytes_to_file(data: bytes, file_path: str) -> str:
     """
     Save bytes data to file
@@ -183,6 +208,43 @@ def save_bytes_to_file(data: bytes, file_path: str) -> str:
     return os.path.abspath(file_path)
 
 
+def link_or_copy(src: str, dst: str) -> str:
+    """
+    Make dst refer to the same content as src, preferring a hardlink
+    
+    Hardlinking is O(1) and shares storage; when src and dst are on
+    different filesystems (or links are unsupported) the file is copied.
+    Only use this for files that are not modified in place afterwards.
+    
+    Args:
+        src: Source file path
+        dst: Destination file path (replaced if it exists)
+    
+    Returns:
+        Destination path
+    """
+    dst_dir = os.path.dirname(os.path.abspath(dst))
+    os.makedirs(dst_dir, exist_ok=True)
+    
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        return dst
+    
+    if os.stat(src).st_dev == os.stat(dst_dir).st_dev:
+        # Link under a temp name, then rename over dst (os.link won't overwrite)
+        tmp_path = f"{dst}.{os.getpid()}.link"
+        try:
+            os.link(src, tmp_path)
+            os.replace(tmp_path, dst)
+            return dst
+        except OSError:
+            if os.path.lexists(tmp_path):
+                os.remove(tmp_path)
+    
+    # shutil.copy2 uses sendfile(2) on Linux
+    shutil.copy2(src, dst)
+    return dst
+
+
 def ensure_dir(path: str) -> str:
     """
     Ensure directory exists, create if not
@@ -275,6 +337,16 @@ def get_task_path(task_id: str, *paths: str) -> str:
     return task_dir
 
 
+# File extension per frame file type
+_FRAME_FILE_EXTENSIONS = {
+    "audio": "mp3",
+    "image": "png",
+    "video": "mp4",
+    "composed": "png",
+    "segment": "mp4"
+}
+
+
 def get_task_frame_path(
     task_id: str, 
     frame_index: int, 
@@ -295,19 +367,36 @@ def get_task_frame_path(
         >>> get_task_frame_path("20251028_143052_ab3d", 0, "audio")
         >>> # Returns: ".../output/20251028_143052_ab3d/frames/01_audio.mp3"
     """
-    ext_map = {
-        "audio": "mp3",
-        "image": "png",
-        "video": "mp4",
-        "composed": "png",
-        "segment": "mp4"
-    }
-    
     # Frame number starts from 01 for better human readability
-    filename = f"{frame_index + 1:02d}_{file_type}.{ext_map[file_type]}"
+    filename = f"{frame_index + 1:02d}_{file_type}.{_FRAME_FILE_EXTENSIONS[file_type]}"
     return get_task_path(task_id, "frames", filename)
 
 
+def get_task_frame_paths(task_id: str, frame_index: int) -> Dict[str, str]:
+    """
+    Get all frame file paths within task directory at once
+    
+    Equivalent to calling get_task_frame_path() for every file type, but
+    resolves the task directory only once.
+    
+    Args:
+        task_id: Task ID
+        frame_index: Frame index (0-based internally, but filename starts from 01)
+    
+    Returns:
+        Dict mapping file type (audio/image/video/composed/segment) to absolute path
+    
+    Example:
+        >>> get_task_frame_paths("20251028_143052_ab3d", 0)["segment"]
+        >>> # Returns: ".../output/20251028_143052_ab3d/frames/01_segment.mp4"
+    """
+    frames_dir = get_task_path(task_id, "frames")
+    return {
+        file_type: os.path.join(frames_dir, f"{frame_index + 1:02d}_{file_type}.{ext}")
+        for file_type, ext in _FRAME_FILE_EXTENSIONS.items()
+    }
+
+
 def get_task_final_video_path(task_id: str) -> str:
     """
     Get final video path within task directory
@@ -16,6 +16,89 @@ Prompt helper utilities
 Simple utilities for building prompts with optional prefixes.
 """
 
+import sys
+from json.encoder import ESCAPE, encode_basestring
+from string import Formatter
+from typing import Any, Dict, Final, List, Optional, Sequence, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
+
+
+CompiledTemplate = List[Tuple[str, Optional[str]]]
+
+
+class Fragments(list):
+    """String fragments spliced as-is into a rendered template (no str() call)"""
+
+
+# Fragments repeated verbatim across the JSON-output prompt templates.
+# Kept brace-free so they can be concatenated into both str.format templates
+# and plain (unformatted) prompts.
+JSON_OUTPUT_REMINDERS: Final[str] = sys.intern(
+    "1. Only output JSON format content, do not add any explanations\n"
+    "2. Ensure JSON format is strictly correct and can be directly parsed by the program\n"
+)
+JSON_ONLY_INSTRUCTION: Final[str] = sys.intern("Only output JSON, no other content.")
+
+
+def compile_template(template: str) -> CompiledTemplate:
+    """
+    Pre-parse a str.format template into (literal, field_name) chunks
+    
+    Parsing is done once (typically at module import) so rendering does not
+    re-scan the whole template for braces on every call. Escaped braces
+    (``{{`` / ``}}``) come back as plain literal text.
+    
+    Args:
+        template: Template using str.format placeholders (no format specs)
+    
+    Returns:
+        List of (literal, field_name) tuples; field_name is None for the
+        trailing literal
+    
+    Examples:
+        >>> compile_template("Hi {name}, {{ok}}")
+        [('Hi ', 'name'), (', {', None), ('ok}', None)]
+    """
+    return [
+        (literal, field_name)
+        for literal, field_name, _, _ in Formatter().parse(template)
+    ]
+
+
+def render_template(compiled: CompiledTemplate, values: Dict[str, Any]) -> str:
+    """
+    Render a template produced by compile_template()
+    
+    All pieces are collected into one list and joined once. A Fragments value
+    is spliced in piece by piece instead of being joined into one string
+    first (e.g. the narrations JSON from narrations_json_fragments).
+    
+    Args:
+        compiled: Output of compile_template()
+        values: Field values (Fragments values are spliced as-is)
+    
+    Returns:
+        Rendered string, same as template.format(**values)
+    
+    Examples:
+        >>> render_template(compile_template("Hi {name}"), {"name": "Bob"})
+        'Hi Bob'
+    """
+    parts = []
+    for literal, field_name in compiled:
+        parts.append(literal)
+        if field_name is not None:
+            value = values[field_name]
+            if isinstance(value, Fragments):
+                parts.extend(value)
+            else:
+                parts.append(str(value))
+    return "".join(parts)
+
 
 def build_image_prompt(prompt: str, prefix: str = "") -> str:
     """
@@ -48,3 +131,40 @@ def build_image_prompt(prompt: str, prefix: str = "") -> str:
     else:
         return prompt
 
+
+def narrations_json_fragments(narrations: Sequence[str]) -> Fragments:
+    """
+    Serialize narrations as {"narrations": [...]} JSON, as template fragments
+    
+    Output is compact (no indentation): the LLM parses it the same way and
+    the prompt carries fewer input tokens. Narrations are usually plain
+    prose with nothing to escape; in that case they are quoted and spliced
+    directly, with no intermediate JSON string. Otherwise the block is
+    encoded as a single string with orjson when installed, or each
+    narration is escaped with the C-accelerated stdlib string encoder.
+    
+    Args:
+        narrations: Narration texts
+    
+    Returns:
+        Fragments whose concatenation is the compact JSON block
+    
+    Examples:
+        >>> "".join(narrations_json_fragments(["a", "b"]))
+        '{"narrations":["a","b"]}'
+    """
+    if not any(ESCAPE.search(narration) for narration in narrations):
+        if not narrations:
+            return Fragments(['{"narrations":[]}'])
+        return Fragments(['{"narrations":["', '","'.join(narrations), '"]}'])
+    
+    if orjson is not None:
+        return Fragments([orjson.dumps({"narrations": list(narrations)}).decode()])
+    
+    fragments = Fragments(['{"narrations":['])
+    for i, narration in enumerate(narrations):
+        if i:
+            fragments.append(",")
+        fragments.append(encode_basestring(narration))
+    fragments.append("]}")
+    return fragments
@@ -15,6 +15,7 @@ Template utility functions for size parsing and template management
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple, Optional, Literal
 from pydantic import BaseModel, Field
@@ -313,10 +314,39 @@ def get_templates_grouped_by_size() -> dict:
     return sorted_grouped
 
 
+@lru_cache(maxsize=64)
+def _parse_template_input(template_input: str) -> Tuple[Optional[str], Optional[str]]:
+    """Split a template input into (size, template_name) (see resolve_template_path)"""
+    # Parse input to extract size and template name
+    size = None
+    template_name = None
+    
+    # Handle different input formats
+    if template_input.startswith("templates/") or template_input.startswith("data/templates/"):
+        # Legacy full path format - extract size and name
+        parts = Path(template_input).parts
+        if len(parts) >= 3:
+            size = parts[-2]
+            template_name = parts[-1]
+    elif '/' in template_input and 'x' in template_input.split('/')[0]:
+        # "1080x1920/template.html" format
+        size, template_name = template_input.split('/', 1)
+    else:
+        # Just template name - use default size
+        size = "1080x1920"
+        template_name = template_input
+    
+    return size, template_name
+
+
 def resolve_template_path(template_input: Optional[str]) -> str:
     """
     Resolve template input to full path with validation (checks data/templates/ first, then templates/)
     
+    Only the parsing of template_input is cached; the location lookup runs
+    on every call, so custom templates added or removed at runtime are
+    picked up.
+    
     Args:
         template_input: Can be:
             - None: Use default "1080x1920/image_default.html"
@@ -343,24 +373,7 @@ def resolve_template_path(template_input: Optional[str]) -> str:
     if template_input is None:
         template_input = "1080x1920/image_default.html"
     
-    # Parse input to extract size and template name
-    size = None
-    template_name = None
-    
-    # Handle different input formats
-    if template_input.startswith("templates/") or template_input.startswith("data/templates/"):
-        # Legacy full path format - extract size and name
-        parts = Path(template_input).parts
-        if len(parts) >= 3:
-            size = parts[-2]
-            template_name = parts[-1]
-    elif '/' in template_input and 'x' in template_input.split('/')[0]:
-        # "1080x1920/template.html" format
-        size, template_name = template_input.split('/', 1)
-    else:
-        # Just template name - use default size
-        size = "1080x1920"
-        template_name = template_input
+    size, template_name = _parse_template_input(template_input)
     
     # Backward compatibility: migrate "default.html" to "image_default.html"
     if template_name == "default.html":
@@ -18,6 +18,7 @@ Currently, TTS service uses ComfyUI workflows only.
 """
 
 import asyncio
+import re
 import ssl
 import random
 import certifi
@@ -26,6 +27,8 @@ from edge_tts.exceptions import NoAudioReceived
 from loguru import logger
 from aiohttp import WSServerHandshakeError, ClientResponseError
 
+from pixelle_video.utils.media_probe import probe_audio_duration
+
 
 # Use certifi bundle for SSL verification instead of disabling it
 _USE_CERTIFI_SSL = True
@@ -234,6 +237,11 @@ def get_audio_duration(audio_path: str) -> float:
     Returns:
         Duration in seconds
     """
+    # Fast path: read duration from file headers (no ffprobe subprocess)
+    duration = probe_audio_duration(audio_path)
+    if duration:
+        return duration
+    
     try:
         # Try using ffmpeg-python
         import ffmpeg
@@ -250,6 +258,33 @@ def get_audio_duration(audio_path: str) -> float:
         return max(1.0, estimated_duration)  # At least 1 second
 
 
+# Conservative speaking rates at speed 1.0 (real speech is usually a bit faster)
+_CJK_CHARS_PER_SECOND = 4.0
+_WORDS_PER_SECOND = 2.5
+_CJK_CHAR = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af]")
+
+
+def estimate_speech_duration(text: str, speed: float = 1.0) -> float:
+    """
+    Estimate spoken duration of text without synthesizing it
+    
+    CJK characters and space-separated words are counted separately. The
+    estimate is biased long (slow speaking rate plus a small margin), so
+    media generated against it is trimmed rather than padded.
+    
+    Args:
+        text: Narration text
+        speed: TTS speed multiplier (1.0 = normal)
+    
+    Returns:
+        Estimated duration in seconds (at least 2 seconds)
+    """
+    cjk_chars = len(_CJK_CHAR.findall(text or ""))
+    words = len(_CJK_CHAR.sub(" ", text or "").split())
+    seconds = cjk_chars / _CJK_CHARS_PER_SECOND + words / _WORDS_PER_SECOND
+    return max(2.0, seconds / max(speed, 0.1) * 1.1 + 0.5)
+
+
 async def list_voices(locale: str = None, retry_count: int = _RETRY_COUNT, retry_base_delay: float = _RETRY_BASE_DELAY) -> list[str]:
     """
     List all available voices for Edge TTS
@@ -0,0 +1,126 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests for pixelle_video.utils.generation_cache and os_util.link_or_copy
+"""
+
+import os
+import time
+
+import pytest
+
+from pixelle_video.utils.generation_cache import (
+    file_fingerprint,
+    load_cached_output,
+    make_cache_key,
+    prune_cache,
+    save_cached_output,
+)
+from pixelle_video.utils.os_util import link_or_copy
+
+
+@pytest.fixture
+def project_root(tmp_path, monkeypatch):
+    """Point the data/cache folders at a temporary project root"""
+    monkeypatch.setenv("PIXELLE_VIDEO_ROOT", str(tmp_path))
+    return tmp_path
+
+
+def test_cache_key_ignores_param_order():
+    assert make_cache_key({"a": 1, "b": "x"}) == make_cache_key({"b": "x", "a": 1})
+    assert make_cache_key({"a": 1}) != make_cache_key({"a": 2})
+
+
+def test_save_and_load_round_trip(project_root):
+    source = project_root / "gen.mp3"
+    source.write_bytes(b"audio")
+    key = make_cache_key({"text": "hello"})
+
+    save_cached_output("tts", key, str(source), {"duration": 1.5})
+
+    output = project_root / "out" / "frame.mp3"
+    assert load_cached_output("tts", key, str(output)) == {"duration": 1.5}
+    assert output.read_bytes() == b"audio"
+
+
+def test_load_miss_returns_none(project_root):
+    assert load_cached_output("tts", make_cache_key({"text": "x"}), str(project_root / "a.mp3")) is None
+
+
+def test_load_ignores_corrupt_metadata(project_root):
+    source = project_root / "gen.mp3"
+    source.write_bytes(b"audio")
+    key = make_cache_key({"text": "hello"})
+    save_cached_output("tts", key, str(source), {"duration": 1.5})
+    (project_root / "data" / "cache" / "tts" / f"{key}.json").write_text("{not json")
+
+    assert load_cached_output("tts", key, str(project_root / "frame.mp3")) is None
+
+
+def test_file_fingerprint_tracks_content(tmp_path):
+    path = tmp_path / "workflow.json"
+    path.write_text("{}")
+    before = file_fingerprint(str(path))
+    path.write_text('{"a": 1}')
+
+    assert file_fingerprint(str(path)) != before
+    assert file_fingerprint(str(tmp_path / "missing.json")) is None
+
+
+def test_link_or_copy_replaces_destination(tmp_path):
+    src = tmp_path / "src.mp4"
+    src.write_bytes(b"new")
+    dst = tmp_path / "sub" / "dst.mp4"
+    dst.parent.mkdir()
+    dst.write_bytes(b"old")
+
+    assert link_or_copy(str(src), str(dst)) == str(dst)
+    assert dst.read_bytes() == b"new"
+    assert not [p for p in dst.parent.iterdir() if p.name != "dst.mp4"]
+
+
+def test_link_or_copy_same_file_is_noop(tmp_path):
+    src = tmp_path / "src.mp4"
+    src.write_bytes(b"data")
+
+    link_or_copy(str(src), str(src))
+
+    assert src.read_bytes() == b"data"
+
+
+def _cache_entry(project_root, key: str, size: int, last_used: float):
+    source = project_root / f"{key}.src.mp3"
+    source.write_bytes(bytes(size))
+    save_cached_output("tts", key, str(source), {"duration": 1.0})
+    for name in (f"{key}.mp3", f"{key}.json"):
+        os.utime(project_root / "data" / "cache" / "tts" / name, (last_used, last_used))
+
+
+def test_prune_cache_evicts_least_recently_used(project_root):
+    now = time.time()
+    for i, key in enumerate(["old", "mid", "new"]):
+        _cache_entry(project_root, key, 100, now - 300 + 100 * i)
+
+    assert prune_cache("tts", max_bytes=150, max_age=3600) == 2
+    remaining = sorted(p.name for p in (project_root / "data" / "cache" / "tts").iterdir())
+    assert remaining == ["new.json", "new.mp3"]
+
+
+def test_prune_cache_evicts_expired_entries(project_root):
+    now = time.time()
+    _cache_entry(project_root, "stale", 10, now - 7200)
+    _cache_entry(project_root, "fresh", 10, now)
+
+    assert prune_cache("tts", max_bytes=10 ** 9, max_age=3600) == 1
+    assert load_cached_output("tts", "fresh", str(project_root / "out.mp3")) is not None
+    assert load_cached_output("tts", "stale", str(project_root / "out.mp3")) is None
@@ -0,0 +1,137 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Byte-level tests for the header parsers in pixelle_video.utils.media_probe
+"""
+
+import struct
+import wave
+
+import pytest
+
+from pixelle_video.utils.media_probe import probe_audio_duration, probe_video_duration
+
+# MPEG 1 Layer III, 128 kbps, 44.1 kHz, stereo, no CRC, no padding
+MP3_HEADER = b"\xff\xfb\x90\x00"
+MP3_FRAME_SIZE = 144 * 128000 // 44100
+
+
+def _write(tmp_path, name: str, data: bytes) -> str:
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+
+def _mp3_frames(n: int) -> bytes:
+    return (MP3_HEADER + bytes(MP3_FRAME_SIZE - 4)) * n
+
+
+def _atom(kind: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I4s", 8 + len(payload), kind) + payload
+
+
+def _mvhd_v0(timescale: int, duration: int) -> bytes:
+    return _atom(b"mvhd", struct.pack(">4sIIII", bytes(4), 0, 0, timescale, duration) + bytes(80))
+
+
+def _ftyp() -> bytes:
+    return _atom(b"ftyp", b"isom" + bytes(4))
+
+
+# WAV
+
+def test_wav_duration(tmp_path):
+    path = str(tmp_path / "a.wav")
+    with wave.open(path, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(8000)
+        w.writeframes(bytes(2 * 4000))
+
+    assert probe_audio_duration(path) == pytest.approx(0.5)
+
+
+def test_wav_garbage_returns_none(tmp_path):
+    assert probe_audio_duration(_write(tmp_path, "a.wav", b"RIFF\x00\x00")) is None
+
+
+# MP3
+
+def test_mp3_cbr_duration(tmp_path):
+    path = _write(tmp_path, "a.mp3", _mp3_frames(100))
+
+    assert probe_audio_duration(path) == pytest.approx(100 * MP3_FRAME_SIZE * 8 / 128000)
+
+
+def test_mp3_skips_id3_tags(tmp_path):
+    id3v2 = b"ID3\x04\x00\x00" + bytes([0, 0, 0, 20]) + bytes(20)
+    id3v1 = b"TAG" + bytes(125)
+    path = _write(tmp_path, "a.mp3", id3v2 + _mp3_frames(100) + id3v1)
+
+    assert probe_audio_duration(path) == pytest.approx(100 * MP3_FRAME_SIZE * 8 / 128000)
+
+
+def test_mp3_xing_frame_count(tmp_path):
+    # Stereo MPEG 1: the Xing header follows 32 bytes of side information
+    xing = b"Xing" + struct.pack(">II", 0x1, 1000)
+    first_frame = MP3_HEADER + bytes(32) + xing
+    first_frame += bytes(MP3_FRAME_SIZE - len(first_frame))
+    path = _write(tmp_path, "a.mp3", first_frame + _mp3_frames(10))
+
+    assert probe_audio_duration(path) == pytest.approx(1000 * 1152 / 44100)
+
+
+def test_mp3_without_frame_sync_returns_none(tmp_path):
+    assert probe_audio_duration(_write(tmp_path, "a.mp3", bytes(4096))) is None
+
+
+def test_unsupported_audio_extension_returns_none(tmp_path):
+    assert probe_audio_duration(_write(tmp_path, "a.flac", _mp3_frames(10))) is None
+
+
+# MP4
+
+def test_mp4_moov_after_mdat(tmp_path):
+    data = _ftyp() + _atom(b"mdat", bytes(1000)) + _atom(b"moov", _mvhd_v0(1000, 2500))
+
+    assert probe_video_duration(_write(tmp_path, "a.mp4", data)) == pytest.approx(2.5)
+
+
+def test_mp4_mvhd_version_1(tmp_path):
+    mvhd = _atom(b"mvhd", b"\x01" + bytes(3) + struct.pack(">QQIQ", 0, 0, 600, 1800) + bytes(80))
+    data = _ftyp() + _atom(b"moov", mvhd)
+
+    assert probe_video_duration(_write(tmp_path, "a.mov", data)) == pytest.approx(3.0)
+
+
+def test_mp4_64bit_atom_size(tmp_path):
+    mdat = struct.pack(">I4sQ", 1, b"mdat", 16 + 100) + bytes(100)
+    data = _ftyp() + mdat + _atom(b"moov", _mvhd_v0(90000, 180000))
+
+    assert probe_video_duration(_write(tmp_path, "a.mp4", data)) == pytest.approx(2.0)
+
+
+@pytest.mark.parametrize("cut", [0, 1, 4, 10, 19])
+def test_mp4_truncated_mvhd_returns_none(tmp_path, cut):
+    # moov and mvhd headers promise a payload the file does not contain
+    mvhd = _mvhd_v0(1000, 2500)
+    data = _ftyp() + _atom(b"moov", mvhd)
+    data = data[:len(data) - len(mvhd) + 8 + cut]
+
+    assert probe_video_duration(_write(tmp_path, "a.mp4", data)) is None
+
+
+def test_mp4_without_moov_returns_none(tmp_path):
+    data = _ftyp() + _atom(b"mdat", bytes(100))
+
+    assert probe_video_duration(_write(tmp_path, "a.mp4", data)) is None
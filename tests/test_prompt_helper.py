@@ -0,0 +1,62 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests for template rendering and JSON fragments in pixelle_video.utils.prompt_helper
+"""
+
+import json
+
+import pytest
+
+from pixelle_video.utils import prompt_helper
+from pixelle_video.utils.prompt_helper import (
+    Fragments,
+    compile_template,
+    narrations_json_fragments,
+    render_template,
+)
+
+
+@pytest.mark.parametrize("template", [
+    "Hi {name}",
+    "{name} and {{braces}} and {other}",
+    "no fields at all",
+    "",
+])
+def test_render_template_matches_str_format(template):
+    values = {"name": "Bob", "other": 3}
+
+    assert render_template(compile_template(template), values) == template.format(**values)
+
+
+def test_render_template_splices_fragments():
+    compiled = compile_template("<{block}>")
+
+    assert render_template(compiled, {"block": Fragments(["a", "b", "c"])}) == "<abc>"
+
+
+@pytest.mark.parametrize("narrations", [
+    [],
+    ["plain prose", "中文旁白"],
+    ['needs "quotes"', "back\\slash", "new\nline", "tab\there", "ctrl\x01"],
+])
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_narrations_json_fragments_match_json_dumps(narrations, use_orjson, monkeypatch):
+    if not use_orjson:
+        monkeypatch.setattr(prompt_helper, "orjson", None)
+    elif prompt_helper.orjson is None:
+        pytest.skip("orjson not installed")
+
+    rendered = "".join(narrations_json_fragments(narrations))
+
+    assert rendered == json.dumps({"narrations": narrations}, ensure_ascii=False, separators=(",", ":"))
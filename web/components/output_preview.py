@@ -192,11 +192,10 @@ def render_single_output(pixelle_video, video_params):
                     
                     # Download button
                     with open(result.video_path, "rb") as video_file:
-                        video_bytes = video_file.read()
                         video_filename = os.path.basename(result.video_path)
                         st.download_button(
                             label="⬇️ 下载视频" if get_language() == "zh_CN" else "⬇️ Download Video",
-                            data=video_bytes,
+                            data=video_file,
                             file_name=video_filename,
                             mime="video/mp4",
                             use_container_width=True
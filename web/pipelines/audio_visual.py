@@ -1,3 +1,4 @@
+import asyncio
 import os
 import time
 from pathlib import Path
@@ -5,14 +6,18 @@ from typing import Any
 
 import streamlit as st
 from loguru import logger
-import httpx
 from web.i18n import tr, get_language
 from web.pipelines.base import PipelineUI, register_pipeline_ui
 from web.components.content_input import render_bgm_section, render_version_info
 from web.utils.async_helpers import run_async
+from web.utils.download_helpers import create_download_client, download_to_file, progress_bar_callback
+from web.utils.workflow_helpers import VIDEO_OUTPUT_KEYS, first_output, resolve_workflow_input
 from pixelle_video.config import config_manager
 from pixelle_video.utils.os_util import create_task_output_dir
 
+_WORKFLOW_PATH = Path("workflows/runninghub/audio_visual.json")
+
+
 class AudioVisualPipelineUI(PipelineUI):
     """
     UI for the Audio-visual synchronization Video Generation Pipeline.
@@ -155,49 +160,30 @@ class AudioVisualPipelineUI(PipelineUI):
                         task_dir, task_id = create_task_output_dir()
                         kit = await pixelle_video._get_or_create_comfykit()
 
-                        import json
-                        from pathlib import Path
-
                         status_text.text(tr("progress.generation"))
                         progress_bar.progress(65)
                         image_path = audio_assets[0]
                         prompt = prompt_text
 
-                        workflow_path = Path("workflows/runninghub/audio_visual.json")
-                        if not workflow_path.exists():
-                            raise Exception(f"The workflow file does not exist: {workflow_path}")
-                        with open(workflow_path, 'r', encoding='utf-8') as f:
-                            workflow_config = json.load(f)
+                        workflow_input = await asyncio.to_thread(resolve_workflow_input, _WORKFLOW_PATH)
                         workflow_params = {
                             "image": image_path,
                             "prompt": prompt
                         }
-                        if workflow_config.get("source") == "runninghub" and "workflow_id" in workflow_config:
-                            workflow_input = workflow_config["workflow_id"]
-                        else:
-                            workflow_input = str(workflow_path)
                         video_result = await kit.execute(workflow_input, workflow_params)
 
-                        generated_video_url = None
-                        if hasattr(video_result, 'videos') and video_result.videos:
-                            generated_video_url = video_result.videos[0]
-                        elif hasattr(video_result, 'outputs') and video_result.outputs:
-                            for node_id, node_output in video_result.outputs.items():
-                                if isinstance(node_output, dict) and 'videos' in node_output:
-                                    videos = node_output['videos']
-                                    if videos and len(videos) > 0:
-                                        generated_video_url = videos[0]
-                                        break
+                        generated_video_url = first_output(video_result, "videos", VIDEO_OUTPUT_KEYS)
                         if not generated_video_url:
                             raise Exception("The workflow did not return a video. Please check the workflow configuration.")
                                     
                         final_video_path = os.path.join(task_dir, "final.mp4")
-                        timeout = httpx.Timeout(300.0)
-                        async with httpx.AsyncClient(timeout=timeout) as client:
-                            response = await client.get(generated_video_url)
-                            response.raise_for_status()
-                            with open(final_video_path, 'wb') as f:
-                                f.write(response.content)
+                        async with create_download_client() as client:
+                            await download_to_file(
+                                client,
+                                generated_video_url,
+                                final_video_path,
+                                on_progress=progress_bar_callback(progress_bar, 70, 99)
+                            )
                         progress_bar.progress(100)
                         status_text.text(tr("status.success"))
                         return final_video_path
@@ -231,11 +217,10 @@ class AudioVisualPipelineUI(PipelineUI):
                         
                         # Download button
                         with open(final_video_path, "rb") as video_file:
-                            video_bytes = video_file.read()
                             video_filename = os.path.basename(final_video_path)
                             st.download_button(
                                 label="⬇️ 下载视频" if get_language() == "zh_CN" else "⬇️ Download Video",
-                                data=video_bytes,
+                                data=video_file,
                                 file_name=video_filename,
                                 mime="video/mp4",
                                 use_container_width=True
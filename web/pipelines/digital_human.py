@@ -1,20 +1,219 @@
+import asyncio
+import hashlib
 import os
+import shutil
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
 from typing import Any
 
 import streamlit as st
+from PIL import Image, ImageOps
 from loguru import logger
+from streamlit.runtime.uploaded_file_manager import UploadedFile
 import httpx
 from web.i18n import tr, get_language
 from web.pipelines.base import PipelineUI, register_pipeline_ui
 from web.components.content_input import render_bgm_section, render_version_info
 from web.components.digital_tts_config import render_style_config
 from web.utils.async_helpers import run_async
+from web.utils.download_helpers import create_download_client, download_to_file, progress_bar_callback
+from web.utils.workflow_helpers import (
+    IMAGE_OUTPUT_KEYS,
+    TEXT_OUTPUT_KEYS,
+    VIDEO_OUTPUT_KEYS,
+    first_output,
+    load_workflow,
+    resolve_workflow_input,
+)
 from pixelle_video.config import config_manager
+from pixelle_video.utils.generation_cache import load_cached_output, save_cached_output
+from pixelle_video.utils.media_probe import probe_audio_duration
 from pixelle_video.utils.os_util import create_task_output_dir
 
+# Uploaded files are stored by content hash here, shared across reruns
+_ASSET_CACHE_DIR = Path("temp/assets_cache")
+
+# Uploaded files are copied to disk through a bounded buffer of this size
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+_MAX_UPLOAD_WORKERS = 8
+
+# O_SEQUENTIAL hints the Windows cache manager that the copy is written
+# front to back; it and O_BINARY are 0 on other platforms
+_UPLOAD_OPEN_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    | getattr(os, "O_BINARY", 0) | getattr(os, "O_SEQUENTIAL", 0)
+)
+
+# Workflows run by this pipeline: goods image synthesis (with generated
+# narration text), goods image composition, and the final talking video
+_IMAGE_WORKFLOW_PATH = Path("workflows/runninghub/digital_image.json")
+_CUSTOMIZE_WORKFLOW_PATH = Path("workflows/runninghub/digital_customize.json")
+_COMBINATION_WORKFLOW_PATH = Path("workflows/runninghub/digital_combination.json")
+
+# Image types accepted by the uploaders, with and without the leading dot
+_IMAGE_UPLOAD_TYPES = ("jpg", "jpeg", "png", "webp")
+_IMAGE_EXTENSIONS = frozenset(f".{ext}" for ext in _IMAGE_UPLOAD_TYPES)
+
+# Upload previews are laid out in rows of this many fixed-width images
+_PREVIEW_COLUMNS = 3
+_PREVIEW_WIDTH = 200
+_PREVIEW_THUMBNAIL_SIZE = (400, 400)
+
+
+@lru_cache(maxsize=512)
+def _tr(key: str, lang: str) -> str:
+    """
+    Translate a key without format parameters, cached per language
+    
+    The render methods run on every Streamlit rerun; passing the current
+    language keeps cached strings correct after a language switch.
+    """
+    return tr(key)
+
+
+async def _generate_narration(pixelle_video: Any, text: str, output_path: str, voice: str, speed: float) -> str:
+    """
+    Generate narration with local TTS, cached by text, voice and speed
+    
+    Entries live in the storyboard pipeline's "tts" cache namespace and use
+    the same key (TTSService.cache_key), so identical narrations are shared
+    between them.
+    
+    Returns:
+        output_path
+    """
+    tts_params = {"text": text, "inference_mode": "local", "voice": voice, "speed": speed}
+    cache_key = await asyncio.to_thread(pixelle_video.tts.cache_key, **tts_params)
+    if await asyncio.to_thread(load_cached_output, "tts", cache_key, output_path) is not None:
+        logger.info(f"🎙️ Narration loaded from cache: {output_path}")
+        return output_path
+    
+    audio_path = await pixelle_video.tts(output_path=output_path, **tts_params)
+    
+    # Cache entries carry the duration; skip caching if it cannot be read cheaply
+    duration = await asyncio.to_thread(probe_audio_duration, audio_path)
+    if duration is not None:
+        await asyncio.to_thread(save_cached_output, "tts", cache_key, audio_path, {"duration": duration})
+    return audio_path
+
+
+def _hash_uploaded_file(uploaded_file) -> str:
+    """Content hash of an uploaded file, read in chunks, stream left at 0"""
+    h = hashlib.blake2b(digest_size=8)
+    uploaded_file.seek(0)
+    while chunk := uploaded_file.read(_UPLOAD_CHUNK_SIZE):
+        h.update(chunk)
+    uploaded_file.seek(0)
+    return h.hexdigest()
+
+
+def _save_uploaded_file(uploaded_file) -> str:
+    """
+    Copy one uploaded file into the asset cache, returns its absolute path
+    
+    Files are named by content hash, so re-uploads and Streamlit reruns
+    with the same file reuse the existing copy instead of writing it again.
+    The cache is disposable, so writes are never flushed or fsynced.
+    """
+    digest = _hash_uploaded_file(uploaded_file)
+    file_path = _ASSET_CACHE_DIR / f"{digest}{Path(uploaded_file.name).suffix.lower()}"
+    
+    if not file_path.exists():
+        # Write under a temp name so an interrupted copy is never reused
+        tmp_path = file_path.with_name(f"{file_path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        fd = os.open(tmp_path, _UPLOAD_OPEN_FLAGS, 0o666)
+        with open(fd, "wb", buffering=_UPLOAD_CHUNK_SIZE) as f:
+            shutil.copyfileobj(uploaded_file, f, length=_UPLOAD_CHUNK_SIZE)
+        uploaded_file.seek(0)
+        os.replace(tmp_path, file_path)
+    
+    return str(file_path.absolute())
+
+
+def _save_uploaded_files(uploaded_files: list) -> list:
+    """
+    Copy uploaded files into the asset cache concurrently
+    
+    Writes release the GIL, so on high-latency storage (NAS, WSL mounts)
+    per-file open/write/close latency overlaps.
+    
+    Returns:
+        Absolute paths, in upload order
+    """
+    _ASSET_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    if len(uploaded_files) == 1:
+        return [_save_uploaded_file(uploaded_files[0])]
+    with ThreadPoolExecutor(max_workers=min(_MAX_UPLOAD_WORKERS, len(uploaded_files))) as executor:
+        return list(executor.map(_save_uploaded_file, uploaded_files))
+
+
+@st.cache_data(show_spinner=False, hash_funcs={UploadedFile: lambda f: (f.file_id, f.name, f.size)})
+def _cached_save_uploaded_files(uploaded_files: tuple) -> list:
+    """_save_uploaded_files, memoized per upload across Streamlit reruns"""
+    return _save_uploaded_files(list(uploaded_files))
+
+
+def _persist_uploaded_files(uploaded_files: list) -> list:
+    """
+    Save uploaded files to the asset cache once per upload
+    
+    Reruns with the same uploads skip hashing and writing altogether; the
+    memo is dropped if any cached file has since been removed from disk.
+    """
+    paths = _cached_save_uploaded_files(tuple(uploaded_files))
+    if not all(os.path.exists(path) for path in paths):
+        _cached_save_uploaded_files.clear()
+        paths = _cached_save_uploaded_files(tuple(uploaded_files))
+    return paths
+
+
+@st.cache_data(show_spinner=False, hash_funcs={UploadedFile: lambda f: (f.file_id, f.name, f.size)})
+def _preview_thumbnail(uploaded_file) -> bytes:
+    """
+    Downscale an uploaded image for preview, encoded once per upload
+    
+    Falls back to the original bytes if the image cannot be decoded.
+    """
+    # Decode straight from the upload buffer instead of copying it out first
+    uploaded_file.seek(0)
+    try:
+        with Image.open(uploaded_file) as im:
+            # Thumbnails drop EXIF, so apply the orientation before resizing
+            im = ImageOps.exif_transpose(im)
+            im.thumbnail(_PREVIEW_THUMBNAIL_SIZE)
+            buf = BytesIO()
+            im.save(buf, "WEBP", quality=80)
+            return buf.getvalue()
+    except Exception as e:
+        logger.debug(f"Preview thumbnail failed for {uploaded_file.name}: {e}")
+        return uploaded_file.getvalue()
+    finally:
+        uploaded_file.seek(0)
+
+
+def _render_image_previews(uploaded_files: list):
+    """
+    Show uploaded images in rows of _PREVIEW_COLUMNS
+    
+    Each row is sent as one st.image call instead of one call per image.
+    """
+    images = [
+        file for file in uploaded_files
+        if Path(file.name).suffix.lower() in _IMAGE_EXTENSIONS
+    ]
+    for start in range(0, len(images), _PREVIEW_COLUMNS):
+        row = images[start:start + _PREVIEW_COLUMNS]
+        st.image(
+            [_preview_thumbnail(file) for file in row],
+            caption=[file.name for file in row],
+            width=_PREVIEW_WIDTH
+        )
+
+
 class DigitalHumanPipelineUI(PipelineUI):
     """
     UI for the Digital_Human Video Generation Pipeline.
@@ -66,120 +265,95 @@ class DigitalHumanPipelineUI(PipelineUI):
     
     def render_digital_human_input(self) -> dict:
         """Render digital human character image upload section"""
+        lang = get_language()
         with st.container(border=True):
-            st.markdown(f"**{tr('digital_human.section.character_assets')}**")
+            st.markdown(f"**{_tr('digital_human.section.character_assets', lang)}**")
             
-            with st.expander(tr("help.feature_description"), expanded=False):
-                st.markdown(f"**{tr('help.what')}**")
-                st.markdown(tr("digital_human.assets.character_what"))
-                st.markdown(f"**{tr('help.how')}**")
-                st.markdown(tr("digital_human.assets.how"))
+            with st.expander(_tr("help.feature_description", lang), expanded=False):
+                st.markdown(f"**{_tr('help.what', lang)}**")
+                st.markdown(_tr("digital_human.assets.character_what", lang))
+                st.markdown(f"**{_tr('help.how', lang)}**")
+                st.markdown(_tr("digital_human.assets.how", lang))
             
             # File uploader for multiple files
             uploaded_files = st.file_uploader(
-                tr("digital_human.assets.upload"),
-                type=["jpg", "jpeg", "png", "webp"],
+                _tr("digital_human.assets.upload", lang),
+                type=_IMAGE_UPLOAD_TYPES,
                 accept_multiple_files=True,
-                help=tr("digital_human.assets.upload_help"),
+                help=_tr("digital_human.assets.upload_help", lang),
                 key="character_files"
             )
             
-            # Save uploaded files to temp directory with unique session ID
+            # Save uploaded files to the content-addressed asset cache
             character_asset_paths = []
             if uploaded_files:
-                import uuid
-                session_id = str(uuid.uuid4()).replace('-', '')[:12]
-                temp_dir = Path(f"temp/assets_{session_id}")
-                temp_dir.mkdir(parents=True, exist_ok=True)
-                
-                for uploaded_file in uploaded_files:
-                    file_path = temp_dir / uploaded_file.name
-                    with open(file_path, "wb") as f:
-                        f.write(uploaded_file.getbuffer())
-                    character_asset_paths.append(str(file_path.absolute()))
+                # Customize mode only ever uses the first character image
+                if st.session_state.get("mode_selection") == "customize":
+                    character_asset_paths = _persist_uploaded_files(uploaded_files[:1])
+                else:
+                    character_asset_paths = _persist_uploaded_files(uploaded_files)
                 
-                st.success(tr("digital_human.assets.character_sucess"))
+                st.success(_tr("digital_human.assets.character_sucess", lang))
                 
                 # Preview uploaded assets
-                with st.expander(tr("digital_human.assets.preview"), expanded=True):
-                    # Show in a grid (3 columns)
-                    cols = st.columns(3)
-                    for i, (file, path) in enumerate(zip(uploaded_files, character_asset_paths)):
-                        with cols[i % 3]:
-                            # Check if image
-                            ext = Path(path).suffix.lower()
-                            if ext in [".jpg", ".jpeg", ".png", ".webp"]:
-                                st.image(file, caption=file.name, use_container_width=True)
+                with st.expander(_tr("digital_human.assets.preview", lang), expanded=True):
+                    _render_image_previews(uploaded_files)
             else:
-                st.info(tr("digital_human.assets.character_empty_hint"))
+                st.info(_tr("digital_human.assets.character_empty_hint", lang))
 
             return {"character_assets": character_asset_paths}
 
     def render_digital_human_mode(self, character_asset_paths: list) -> dict:
+        lang = get_language()
         with st.container(border=True):
-            st.markdown(f"**{tr('digital_human.section.select_mode')}**")
+            st.markdown(f"**{_tr('digital_human.section.select_mode', lang)}**")
             
-            with st.expander(tr("help.feature_description"), expanded=False):
-                st.markdown(f"**{tr('help.what')}**")
-                st.markdown(tr("digital_human.assets.mode_what"))
-                st.markdown(f"**{tr('help.how')}**")
-                st.markdown(tr("digital_human.assets.select_how"))
+            with st.expander(_tr("help.feature_description", lang), expanded=False):
+                st.markdown(f"**{_tr('help.what', lang)}**")
+                st.markdown(_tr("digital_human.assets.mode_what", lang))
+                st.markdown(f"**{_tr('help.how', lang)}**")
+                st.markdown(_tr("digital_human.assets.select_how", lang))
             
             mode = st.radio(
                 "Processing Mode",
                 ["digital", "customize"],
                 horizontal=True,
-                format_func=lambda x: tr(f"mode.{x}"),
+                format_func=lambda x: _tr(f"mode.{x}", lang),
                 label_visibility="collapsed",
                 key="mode_selection"
                 )
             
             # Text input (unified for both modes)
-            text_placeholder = tr("digital_human.input.topic_placeholder") if mode == "digital" else tr("digital_human.input.content_placeholder")
+            text_placeholder = _tr("digital_human.input.topic_placeholder", lang) if mode == "digital" else _tr("digital_human.input.content_placeholder", lang)
             text_height = 120 if mode == "digital" else 200
-            text_help = tr("input.text_help_digital") if mode == "digital" else tr("input.text_help_fixed")
+            text_help = _tr("input.text_help_digital", lang) if mode == "digital" else _tr("input.text_help_fixed", lang)
             
             if mode == "digital":
                 # File uploader for multiple files
                 uploaded_files = st.file_uploader(
-                    tr("digital_human.assets.upload"),
-                    type=["jpg", "jpeg", "png", "webp"],
+                    _tr("digital_human.assets.upload", lang),
+                    type=_IMAGE_UPLOAD_TYPES,
                     accept_multiple_files=True,
-                    help=tr("digital_human.assets.upload_help"),
+                    help=_tr("digital_human.assets.upload_help", lang),
                     key="digital_files"
                 )
                 
-                # Save uploaded files to temp directory with unique session ID
+                # Save uploaded files to the content-addressed asset cache
                 goods_asset_paths = []
                 if uploaded_files:
-                    import uuid
-                    session_id = str(uuid.uuid4()).replace('-', '')[:12]
-                    temp_dir = Path(f"temp/assets_{session_id}")
-                    temp_dir.mkdir(parents=True, exist_ok=True)
-                
-                    for uploaded_file in uploaded_files:
-                        file_path = temp_dir / uploaded_file.name
-                        with open(file_path, "wb") as f:
-                            f.write(uploaded_file.getbuffer())
-                        goods_asset_paths.append(str(file_path.absolute()))
+                    # Only the first goods image is sent to the workflow
+                    goods_asset_paths = _persist_uploaded_files(uploaded_files[:1])
                 
-                    st.success(tr("digital_human.assets.goods_sucess"))
+                    st.success(_tr("digital_human.assets.goods_sucess", lang))
                 
                     # Preview uploaded assets
-                    with st.expander(tr("digital_human.assets.preview"), expanded=True):
-                        # Show in a grid (3 columns)
-                        cols = st.columns(3)
-                        for i, (file, path) in enumerate(zip(uploaded_files, goods_asset_paths)):
-                            with cols[i % 3]:
-                                # Check if image
-                                ext = Path(path).suffix.lower()
-                                if ext in [".jpg", ".jpeg", ".png", ".webp"]:
-                                    st.image(file, caption=file.name, use_container_width=True)
+                    with st.expander(_tr("digital_human.assets.preview", lang), expanded=True):
+                        _render_image_previews(uploaded_files)
                 else:
-                    st.info(tr("digital_human.assets.goods_empty_hint"))
+                    st.info(_tr("digital_human.assets.goods_empty_hint", lang))
                     # Text input
                 goods_text = st.text_area(
-                    tr("digital_human.input_text"),
+                    _tr("digital_human.input_text", lang),
                     placeholder=text_placeholder,
                     height=text_height,
                     help=text_help,
@@ -187,9 +361,9 @@ class DigitalHumanPipelineUI(PipelineUI):
                     )
 
                 goods_title = st.text_input(
-                    tr("digital_human.goods_title"),
-                    placeholder=tr("digital_human.goods_title_placeholder"),
-                    help=tr("digital_human.goods_title_help"),
+                    _tr("digital_human.goods_title", lang),
+                    placeholder=_tr("digital_human.goods_title_placeholder", lang),
+                    help=_tr("digital_human.goods_title_help", lang),
                     key="goods_title"
                 )
 
@@ -203,7 +377,7 @@ class DigitalHumanPipelineUI(PipelineUI):
 
             else:
                 goods_text = st.text_area(
-                    tr("digital_human.customize_text"),
+                    _tr("digital_human.customize_text", lang),
                     placeholder=text_placeholder,
                     height=text_height,
                     help=text_help,
@@ -218,12 +392,13 @@ class DigitalHumanPipelineUI(PipelineUI):
                     
     def _render_output_preview(self, pixelle_video: Any, video_params: dict):
         """Render output preview section"""
+        lang = get_language()
         with st.container(border=True):
-            st.markdown(f"**{tr('section.video_generation')}**")
+            st.markdown(f"**{_tr('section.video_generation', lang)}**")
             
             # Check configuration
             if not config_manager.validate():
-                st.warning(tr("settings.not_configured"))
+                st.warning(_tr("settings.not_configured", lang))
             
             # Get input data
             character_assets = video_params.get("character_assets", [])
@@ -234,17 +409,19 @@ class DigitalHumanPipelineUI(PipelineUI):
             tts_voice = video_params.get("tts_voice", "zh-CN-YunjianNeural")
             tts_speed = video_params.get("tts_speed", 1.2)
             
-            logger.info(f"🔧 The obtained TTS parameters:")
-            logger.info(f"  - tts_voice: {tts_voice}")
-            logger.info(f"  - tts_speed: {tts_speed}")
-            logger.info(f"  - video_params中的tts_voice: {video_params.get('tts_voice', 'NOT_FOUND')}")
-            logger.info(f"  - video_params: {video_params}")
+            # Runs on every rerun: only format the params when DEBUG is enabled
+            logger.opt(lazy=True).debug(
+                "🔧 TTS parameters: tts_voice={}, tts_speed={}, video_params={}",
+                lambda: tts_voice,
+                lambda: tts_speed,
+                lambda: video_params
+            )
             
             # Validation
             if not character_assets:
-                st.info(tr("digital_human.assets.character_warning"))
+                st.info(_tr("digital_human.assets.character_warning", lang))
                 st.button(
-                    tr("btn.generate"),
+                    _tr("btn.generate", lang),
                     type="primary",
                     use_container_width=True,
                     disabled=True,
@@ -253,9 +430,9 @@ class DigitalHumanPipelineUI(PipelineUI):
                 return
             
             if not goods_text and not goods_title:
-                st.info(tr("digital_human.assets.select_mode"))
+                st.info(_tr("digital_human.assets.select_mode", lang))
                 st.button(
-                    tr("btn.generate"),
+                    _tr("btn.generate", lang),
                     type="primary",
                     use_container_width=True,
                     disabled=True,
@@ -264,7 +441,7 @@ class DigitalHumanPipelineUI(PipelineUI):
                 return  
             
             # Generate button
-            if st.button(tr("btn.generate"), type="primary", use_container_width=True, key="digital_human_generate"):
+            if st.button(_tr("btn.generate", lang), type="primary", use_container_width=True, key="digital_human_generate"):
                 # Validate
                 if not config_manager.validate():
                     st.error(tr("settings.not_configured"))
@@ -279,12 +456,27 @@ class DigitalHumanPipelineUI(PipelineUI):
                 try:
                     # Define async generation function
                     async def generate_digital_human_video():
+                        # One pooled client for every download in this task
+                        async with create_download_client() as client:
+                            return await run_generation(client)
+                    
+                    async def run_generation(client: httpx.AsyncClient):
                         task_dir, task_id = create_task_output_dir()
-                        kit = await pixelle_video._get_or_create_comfykit()
-
-                        import json
-                        from pathlib import Path
-
+                        logger.info(f"[Initialization] Task Directory: {task_dir}")
+                        # ComfyKit setup does not depend on the inputs below: start it
+                        # now and await it right before the first workflow submission
+                        kit_task = asyncio.create_task(pixelle_video._get_or_create_comfykit())
+                        try:
+                            return await run_mode(client, task_dir, kit_task)
+                        finally:
+                            # A failure before the first workflow submission must not
+                            # leave ComfyKit setup running, or its error unretrieved
+                            if not kit_task.done():
+                                kit_task.cancel()
+                            elif not kit_task.cancelled():
+                                kit_task.exception()
+                    
+                    async def run_mode(client: httpx.AsyncClient, task_dir: str, kit_task: asyncio.Task):
                         if mode == "customize":
                             status_text.text(tr("progress.step_audio"))
                             progress_bar.progress(25)
@@ -293,192 +485,164 @@ class DigitalHumanPipelineUI(PipelineUI):
 
                             # TTS
                             audio_path = os.path.join(task_dir, "narration.mp3")
-                            await pixelle_video.tts(
-                                text=generated_text,
-                                output_path=audio_path,
-                                inference_mode="local",  
-                                voice=tts_voice,  
-                                speed=tts_speed
+                            # Resolve the second workflow while TTS runs
+                            second_input_task = asyncio.create_task(
+                                asyncio.to_thread(resolve_workflow_input, _COMBINATION_WORKFLOW_PATH)
                             )
+                            try:
+                                await _generate_narration(
+                                    pixelle_video,
+                                    text=generated_text,
+                                    output_path=audio_path,
+                                    voice=tts_voice,
+                                    speed=tts_speed
+                                )
+                            except BaseException:
+                                second_input_task.cancel()
+                                raise
+                            kit = await kit_task
                             progress_bar.progress(65)
                             status_text.text(tr("progress.concatenating"))
 
                             # Directly call the second workflow
-                            second_workflow_path = Path("workflows/runninghub/digital_combination.json")
-                            if not second_workflow_path.exists():
-                                raise Exception(f"The second step workflow file does not exist:{second_workflow_path}")
-                            with open(second_workflow_path, 'r', encoding='utf-8') as f:
-                                second_workflow_config = json.load(f)
                             second_workflow_params = {
                                 "videoimage": generated_image_path,
                                 "audio": audio_path
                             }
-                            if second_workflow_config.get("source") == "runninghub" and "workflow_id" in second_workflow_config:
-                                workflow_input = second_workflow_config["workflow_id"]
-                            else:
-                                workflow_input = str(second_workflow_path)
-                            second_result = await kit.execute(workflow_input, second_workflow_params)
+                            second_workflow_input = await second_input_task
+                            second_result = await kit.execute(second_workflow_input, second_workflow_params)
                             # Video Link Extraction
-                            generated_video_url = None
-                            if hasattr(second_result, 'videos') and second_result.videos:
-                                generated_video_url = second_result.videos[0]
-                            elif hasattr(second_result, 'outputs') and second_result.outputs:
-                                for node_id, node_output in second_result.outputs.items():
-                                    if isinstance(node_output, dict) and 'videos' in node_output:
-                                        videos = node_output['videos']
-                                        if videos and len(videos) > 0:
-                                            generated_video_url = videos[0]
-                                            break
+                            generated_video_url = first_output(second_result, "videos", VIDEO_OUTPUT_KEYS)
                             if not generated_video_url:
                                 raise Exception("The second step of the workflow did not return a video. Please check the workflow configuration.")
                                         
                             final_video_path = os.path.join(task_dir, "final.mp4")
-                            timeout = httpx.Timeout(300.0)
-                            async with httpx.AsyncClient(timeout=timeout) as client:
-                                response = await client.get(generated_video_url)
-                                response.raise_for_status()
-                                with open(final_video_path, 'wb') as f:
-                                    f.write(response.content)
+                            await download_to_file(
+                                client,
+                                generated_video_url,
+                                final_video_path,
+                                on_progress=progress_bar_callback(progress_bar, 70, 99)
+                            )
                             progress_bar.progress(100)
                             status_text.text(tr("status.success"))
                             return final_video_path
                         
                         else:
                             #Initialization and parameter preparation
-                            task_dir, task_id = create_task_output_dir()
-                            logger.info(f"[Initialization] Task Directory: {task_dir}")
-
-                            first_workflow_path = Path("workflows/runninghub/digital_image.json")
-                            third_workflow_path = Path("workflows/runninghub/digital_customize.json")
-                            second_workflow_path = Path("workflows/runninghub/digital_combination.json")
-                            assert first_workflow_path.exists(), "The first_workflow file does not exist."
-                            assert third_workflow_path.exists(), "The third_workflow file does not exist."
-                            assert second_workflow_path.exists(), "The  second_workflow file does not exist."
+                            assert _IMAGE_WORKFLOW_PATH.exists(), "The first_workflow file does not exist."
+                            assert _CUSTOMIZE_WORKFLOW_PATH.exists(), "The third_workflow file does not exist."
+                            assert _COMBINATION_WORKFLOW_PATH.exists(), "The  second_workflow file does not exist."
 
                             if goods_text and goods_text.strip():
-                                workflow_path = third_workflow_path
+                                workflow_path = _CUSTOMIZE_WORKFLOW_PATH
                                 workflow_params = {"firstimage": character_assets[0], "secondimage": goods_assets[0]}
                                 
                                 status_text.text(tr("progress.step_image"))
-                                kit = await pixelle_video._get_or_create_comfykit()
-                                workflow_config = json.load(open(workflow_path, 'r', encoding='utf8'))
+                                kit = await kit_task
+                                workflow_config = await asyncio.to_thread(load_workflow, str(workflow_path))
                                 workflow_input = workflow_config.get("workflow_id", str(workflow_path))
-                                combine_image = await kit.execute(workflow_input, workflow_params)
-                                if combine_image.status != "completed":
-                                    raise Exception(f"workflow execution failed: {combine_image.msg}")
-                                generated_image_url = getattr(combine_image, "images", [None])[0]
-                                status_text.text(tr("progress.step_audio"))
+                                
+                                # The narration text is given, so TTS does not depend on
+                                # the image workflow: run both concurrently
                                 audio_path = os.path.join(task_dir, "narration.mp3")
-                                await pixelle_video.tts(
+                                second_input_task = asyncio.create_task(
+                                    asyncio.to_thread(resolve_workflow_input, _COMBINATION_WORKFLOW_PATH)
+                                )
+                                tts_task = asyncio.create_task(_generate_narration(
+                                    pixelle_video,
                                     text=goods_text,
                                     output_path=audio_path,
-                                    inference_mode="local",  
-                                    voice=tts_voice,  
+                                    voice=tts_voice,
                                     speed=tts_speed
-                                )
+                                ))
+                                try:
+                                    combine_image = await kit.execute(workflow_input, workflow_params)
+                                    if combine_image.status != "completed":
+                                        raise Exception(f"workflow execution failed: {combine_image.msg}")
+                                    generated_image_url = first_output(combine_image, "images", IMAGE_OUTPUT_KEYS)
+                                    status_text.text(tr("progress.step_audio"))
+                                    await tts_task
+                                except BaseException:
+                                    tts_task.cancel()
+                                    second_input_task.cancel()
+                                    raise
                                 progress_bar.progress(65)
                                 status_text.text(tr("progress.progress.concatenating"))
 
-                                second_workflow_path = Path("workflows/runninghub/digital_combination.json")
-                                if not second_workflow_path.exists():
-                                    raise Exception(f"The second step workflow file does not exist:{second_workflow_path}")
-                                with open(second_workflow_path, 'r', encoding='utf-8') as f:
-                                    second_workflow_config = json.load(f)
                                 second_workflow_params = {
                                     "videoimage": generated_image_url,
                                     "audio": audio_path
                                 }
-                                if second_workflow_config.get("source") == "runninghub" and "workflow_id" in second_workflow_config:
-                                    workflow_input = second_workflow_config["workflow_id"]
-                                else:
-                                    workflow_input = str(second_workflow_path)
-                                second_result = await kit.execute(workflow_input, second_workflow_params)
+                                second_workflow_input = await second_input_task
+                                second_result = await kit.execute(second_workflow_input, second_workflow_params)
                                 # Video Link Extraction
-                                generated_video_url = None
-                                if hasattr(second_result, 'videos') and second_result.videos:
-                                    generated_video_url = second_result.videos[0]
-                                elif hasattr(second_result, 'outputs') and second_result.outputs:
-                                    for node_id, node_output in second_result.outputs.items():
-                                        if isinstance(node_output, dict) and 'videos' in node_output:
-                                            videos = node_output['videos']
-                                            if videos and len(videos) > 0:
-                                                generated_video_url = videos[0]
-                                                break
+                                generated_video_url = first_output(second_result, "videos", VIDEO_OUTPUT_KEYS)
                                 if not generated_video_url:
                                     raise Exception("The second step of the workflow did not return a video. Please check the workflow configuration.")
                                             
                                 final_video_path = os.path.join(task_dir, "final.mp4")
-                                timeout = httpx.Timeout(300.0)
-                                async with httpx.AsyncClient(timeout=timeout) as client:
-                                    response = await client.get(generated_video_url)
-                                    response.raise_for_status()
-                                    with open(final_video_path, 'wb') as f:
-                                        f.write(response.content)
+                                await download_to_file(
+                                    client,
+                                    generated_video_url,
+                                    final_video_path,
+                                    on_progress=progress_bar_callback(progress_bar, 70, 99)
+                                )
                                 progress_bar.progress(100)
                                 status_text.text(tr("status.success"))
                                 return final_video_path
                                 
                             else:
-                                workflow_path = first_workflow_path
+                                workflow_path = _IMAGE_WORKFLOW_PATH
                                 workflow_params = {"firstimage": character_assets[0], "secondimage": goods_assets[0], "goodstype": goods_title}
                                 
                                 status_text.text(tr("progress.step_image"))
-                                kit = await pixelle_video._get_or_create_comfykit()
-                                workflow_config = json.load(open(workflow_path, 'r', encoding='utf8'))
+                                kit = await kit_task
+                                workflow_config = await asyncio.to_thread(load_workflow, str(workflow_path))
                                 workflow_input = workflow_config.get("workflow_id", str(workflow_path))
                                 synthesis_result = await kit.execute(workflow_input, workflow_params)
                                 if synthesis_result.status != "completed":
                                     raise Exception(f"workflow execution failed: {synthesis_result.msg}")
-                                generated_image_url = getattr(synthesis_result, "images", [None])[0]
-                                generated_text = getattr(synthesis_result, "texts", [None])[0]
+                                generated_image_url = first_output(synthesis_result, "images", IMAGE_OUTPUT_KEYS)
+                                generated_text = first_output(synthesis_result, "texts", TEXT_OUTPUT_KEYS)
                                 
                                 status_text.text(tr("progress.step_audio"))
                                 audio_path = os.path.join(task_dir, "narration.mp3")
-                                await pixelle_video.tts(
-                                    text=generated_text,
-                                    output_path=audio_path,
-                                    inference_mode="local",  
-                                    voice=tts_voice,  
-                                    speed=tts_speed
+                                # Resolve the second workflow while TTS runs
+                                second_input_task = asyncio.create_task(
+                                    asyncio.to_thread(resolve_workflow_input, _COMBINATION_WORKFLOW_PATH)
                                 )
+                                try:
+                                    await _generate_narration(
+                                        pixelle_video,
+                                        text=generated_text,
+                                        output_path=audio_path,
+                                        voice=tts_voice,
+                                        speed=tts_speed
+                                    )
+                                except BaseException:
+                                    second_input_task.cancel()
+                                    raise
                                 progress_bar.progress(65)
                                 status_text.text(tr("progress.concatenating"))
 
-                                second_workflow_path = Path("workflows/runninghub/digital_combination.json")
-                                if not second_workflow_path.exists():
-                                    raise Exception(f"The second step workflow file does not exist:{second_workflow_path}")
-                                with open(second_workflow_path, 'r', encoding='utf-8') as f:
-                                    second_workflow_config = json.load(f)
                                 second_workflow_params = {
                                     "videoimage": generated_image_url,
                                     "audio": audio_path
                                 }
-                                if second_workflow_config.get("source") == "runninghub" and "workflow_id" in second_workflow_config:
-                                    workflow_input = second_workflow_config["workflow_id"]
-                                else:
-                                    workflow_input = str(second_workflow_path)
-                                second_result = await kit.execute(workflow_input, second_workflow_params)
+                                second_workflow_input = await second_input_task
+                                second_result = await kit.execute(second_workflow_input, second_workflow_params)
                                 # Video Link Extraction
-                                generated_video_url = None
-                                if hasattr(second_result, 'videos') and second_result.videos:
-                                    generated_video_url = second_result.videos[0]
-                                elif hasattr(second_result, 'outputs') and second_result.outputs:
-                                    for node_id, node_output in second_result.outputs.items():
-                                        if isinstance(node_output, dict) and 'videos' in node_output:
-                                            videos = node_output['videos']
-                                            if videos and len(videos) > 0:
-                                                generated_video_url = videos[0]
-                                                break
+                                generated_video_url = first_output(second_result, "videos", VIDEO_OUTPUT_KEYS)
                                 if not generated_video_url:
                                     raise Exception("The second step of the workflow did not return a video. Please check the workflow configuration.")
                                             
                                 final_video_path = os.path.join(task_dir, "final.mp4")
-                                timeout = httpx.Timeout(300.0)
-                                async with httpx.AsyncClient(timeout=timeout) as client:
-                                    response = await client.get(generated_video_url)
-                                    response.raise_for_status()
-                                    with open(final_video_path, 'wb') as f:
-                                        f.write(response.content)
+                                await download_to_file(
+                                    client,
+                                    generated_video_url,
+                                    final_video_path,
+                                    on_progress=progress_bar_callback(progress_bar, 70, 99)
+                                )
                                 progress_bar.progress(100)
                                 status_text.text(tr("status.success"))
                                 return final_video_path
@@ -512,11 +676,10 @@ class DigitalHumanPipelineUI(PipelineUI):
                         
                         # Download button
                         with open(final_video_path, "rb") as video_file:
-                            video_bytes = video_file.read()
                             video_filename = os.path.basename(final_video_path)
                             st.download_button(
                                 label="⬇️ 下载视频" if get_language() == "zh_CN" else "⬇️ Download Video",
-                                data=video_bytes,
+                                data=video_file,
                                 file_name=video_filename,
                                 mime="video/mp4",
                                 use_container_width=True
@@ -0,0 +1,147 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Download helpers for generated workflow outputs
+"""
+
+import asyncio
+import importlib.util
+import os
+from pathlib import Path
+from typing import Callable, Optional
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+import httpx
+
+from pixelle_video.utils.os_util import link_or_copy
+
+# Generated videos are streamed to disk in chunks of this size
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+_SMALL_DOWNLOAD_BYTES = 4 * 1024 * 1024
+_DOWNLOAD_TIMEOUT = httpx.Timeout(300.0)
+_DOWNLOAD_LIMITS = httpx.Limits(max_keepalive_connections=8)
+
+# HTTP/2 needs the optional "h2" package (httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Only advertise brotli when httpx can decode it (optional "brotli" package)
+_DOWNLOAD_HEADERS = {
+    "Accept-Encoding": "gzip, br" if importlib.util.find_spec("brotli") is not None else "gzip"
+}
+
+
+def create_download_client() -> httpx.AsyncClient:
+    """
+    Create a pooled client for the downloads of one generation task
+    
+    Keep one client per task rather than per process: run_async starts a
+    fresh event loop for every generation, and pooled connections cannot
+    be reused from a different loop once the previous one is closed.
+    """
+    return httpx.AsyncClient(
+        timeout=_DOWNLOAD_TIMEOUT,
+        http2=_HTTP2_AVAILABLE,
+        limits=_DOWNLOAD_LIMITS
+    )
+
+
+def progress_bar_callback(progress_bar, start: int, end: int) -> Callable[[int, int], None]:
+    """
+    Map download progress onto the [start, end] range of a Streamlit progress bar
+    
+    The bar is only updated when the displayed percentage changes.
+    """
+    last = start
+    
+    def on_progress(written: int, total: int):
+        nonlocal last
+        if total <= 0:
+            return
+        value = min(end, start + (end - start) * written // total)
+        if value != last:
+            last = value
+            progress_bar.progress(value)
+    
+    return on_progress
+
+
+def _local_source_path(url: str) -> Optional[str]:
+    """Filesystem path behind url if it is a local path or file:// URL, else None"""
+    if os.path.isfile(url):
+        return url
+    parsed = urlparse(url)
+    if parsed.scheme == "file":
+        path = url2pathname(parsed.path)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+async def download_to_file(
+    client: httpx.AsyncClient,
+    url: str,
+    path: str,
+    on_progress: Optional[Callable[[int, int], None]] = None
+) -> str:
+    """
+    Stream url to path using the shared client
+    
+    Every generated asset download goes through here, so transport
+    tweaks (compression, retries) only need to be made once. Local paths
+    and file:// URLs (self-hosted ComfyUI on the same machine) are linked
+    or copied instead of fetched.
+    
+    Args:
+        client: Client from create_download_client
+        url: URL to download
+        path: Destination file path
+        on_progress: Optional callback(written_bytes, total_bytes), called
+            after each chunk; total is 0 when the server sends no length
+    
+    Returns:
+        path
+    """
+    local_path = _local_source_path(url)
+    if local_path is not None:
+        await asyncio.to_thread(link_or_copy, local_path, path)
+        if on_progress:
+            on_progress(1, 1)
+        return path
+    
+    async with client.stream("GET", url, headers=_DOWNLOAD_HEADERS) as response:
+        response.raise_for_status()
+        
+        # The GET response already carries Content-Length, so no HEAD is needed
+        content_length = response.headers.get("content-length", "")
+        total = int(content_length) if content_length.isdigit() else 0
+        
+        # Small responses are buffered and written with a single call
+        if 0 < total < _SMALL_DOWNLOAD_BYTES:
+            content = await response.aread()
+            await asyncio.to_thread(Path(path).write_bytes, content)
+            if on_progress:
+                on_progress(total, total)
+            return path
+        
+        # Disk writes run in a worker thread so the event loop stays free
+        # for progress updates and the next network read
+        f = await asyncio.to_thread(open, path, 'wb')
+        try:
+            async for chunk in response.aiter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                await asyncio.to_thread(f.write, chunk)
+                if on_progress:
+                    on_progress(response.num_bytes_downloaded, total)
+        finally:
+            await asyncio.to_thread(f.close)
+    return path
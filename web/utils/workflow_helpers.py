@@ -0,0 +1,99 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Workflow result helpers for web pipelines
+"""
+
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
+
+
+# Output node keys that may hold each kind of workflow result, in priority order
+VIDEO_OUTPUT_KEYS = ("videos", "video", "output_video", "result_video", "mp4")
+IMAGE_OUTPUT_KEYS = ("images", "image", "output_image", "result_image")
+TEXT_OUTPUT_KEYS = ("texts", "text", "description", "caption")
+
+
+def load_workflow(path: str) -> dict:
+    """
+    Load a workflow JSON file, parsed once per file version
+    
+    The parsed config is cached by (path, mtime), so edits to a workflow
+    file are picked up without restarting the web UI. The returned dict is
+    shared between calls and must not be modified.
+    Blocking; call via asyncio.to_thread from async code.
+    """
+    return _load_workflow_version(path, os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _load_workflow_version(path: str, mtime_ns: int) -> dict:
+    """Parse one version of a workflow file (see load_workflow)"""
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def resolve_workflow_input(workflow_path: Path) -> str:
+    """
+    Get the kit.execute input for a workflow file
+    
+    RunningHub workflows are submitted by workflow_id, anything else by path.
+    Blocking; call via asyncio.to_thread from async code.
+    """
+    try:
+        workflow_config = load_workflow(str(workflow_path))
+    except FileNotFoundError:
+        raise Exception(f"The workflow file does not exist: {workflow_path}") from None
+    if workflow_config.get("source") == "runninghub" and "workflow_id" in workflow_config:
+        return workflow_config["workflow_id"]
+    return str(workflow_path)
+
+
+def first_output(result, attr: str, keys: tuple) -> Optional[Any]:
+    """
+    Get the first value of one kind from a workflow result
+    
+    Checks the result attribute (e.g. result.videos) first, then scans the
+    raw node outputs once for any of keys.
+    
+    Args:
+        result: ComfyKit execution result
+        attr: Result attribute holding this kind of output (e.g. "videos")
+        keys: Node output keys to look for, in priority order
+    
+    Returns:
+        First matching value, or None if the workflow returned none
+    """
+    values = getattr(result, attr, None)
+    if values:
+        return values[0]
+    
+    for node_output in (getattr(result, "outputs", None) or {}).values():
+        if not isinstance(node_output, dict):
+            continue
+        for key in keys:
+            value = node_output.get(key)
+            if not value:
+                continue
+            return value[0] if isinstance(value, list) else value
+    return None